@@ -1,14 +1,57 @@
 # Import parent dir to access options_schema
 import sys
+import os
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
 
 from optionsconfig import EnvBuilder, ReadmeBuilder
 
+PYPROJECT_PATH = ROOT_DIR / "pyproject.toml"
+# Repo-root paths used when pyproject.toml can't be read. They override optionsconfig's own defaults,
+# which are resolved relative to its installed package directory rather than this repository
+DEFAULT_OUTPUT_PATHS = {"env_example_path": ".env.example", "readme_path": "README.md"}
+
+def get_generated_files() -> list:
+    """Get the output files written by the builders, as configured in [tool.optionsconfig] of pyproject.toml.
+
+    Returns:
+        list[Path]: Absolute paths of the generated files, resolved against the repository root
+    """
+    output_paths = dict(DEFAULT_OUTPUT_PATHS)
+    try:
+        import tomllib  # Python 3.11+
+        with open(PYPROJECT_PATH, "rb") as f:
+            config = tomllib.load(f).get("tool", {}).get("optionsconfig", {})
+        output_paths.update({key: config[key] for key in output_paths if key in config})
+    except (ImportError, OSError, ValueError):
+        pass
+    return [ROOT_DIR / path for path in output_paths.values()]
+
 def build_docs() -> None:
-    """Build documentation files like .env.example and README.md based on the options schema."""
-    EnvBuilder().build()
-    ReadmeBuilder().build()
+    """Build documentation files like .env.example and README.md based on the options schema.
+
+    Files whose content is unchanged keep their original modification time, so
+    tools that track mtimes don't see a rebuild as a change.
+    """
+    generated_files = get_generated_files()
+    previous = {}
+    for file in generated_files:
+        if file.exists():
+            previous[file] = (file.read_bytes(), file.stat())
+
+    # The builders resolve their configured paths against the working directory
+    original_cwd = os.getcwd()
+    os.chdir(ROOT_DIR)
+    try:
+        EnvBuilder().build()
+        ReadmeBuilder().build()
+    finally:
+        os.chdir(original_cwd)
+
+    for file, (content, stat) in previous.items():
+        if file.exists() and file.read_bytes() == content:
+            os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
 
 if __name__ == "__main__":
-    build_docs()
\ No newline at end of file
+    build_docs()
@@ -7,7 +7,7 @@ from typing import Optional
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from optionsconfig import init_options, Options
-from utils import run_process
+from utils import run_process, dir_has_contents
 from loguru import logger
 
 class BatchExporter:
@@ -43,12 +43,13 @@ class BatchExporter:
         self.command = [
             str(self.executable_path),
             "--preset", "WarRobotsFrontiers",
-            "--pak-files-directory", self.options.steam_game_download_dir,
-            "--export-output-path", self.options.output_data_dir,
-            "--mapping-file-path", self.mapping_file_path,
+            "--pak-files-directory", str(self.options.steam_game_download_dir),
+            "--export-output-path", str(self.options.output_data_dir),
+            "--mapping-file-path", str(self.mapping_file_path),
             "--is-logging-enabled", "true" if self.options.log_level == "DEBUG" else "false",
             "--should-export-textures", "false" if not self.options.should_export_textures else "true"
         ]
+        self._command_str = ' '.join(f'"{arg}"' if ' ' in arg else arg for arg in self.command)
         
         # Validate paths
         self._validate_setup()
@@ -113,7 +114,7 @@ class BatchExporter:
     
     def __str__(self) -> str:
         """Return the command that would be executed as a string."""
-        return ' '.join(f'"{arg}"' if ' ' in arg else arg for arg in self.command)
+        return self._command_str
 
 
 def main(options: Optional[Options] = None, mapping_file_path: Optional[str] = None) -> bool:
@@ -131,7 +132,7 @@ def main(options: Optional[Options] = None, mapping_file_path: Optional[str] = N
         raise ValueError("mapping_file_path must be provided")
     
     # Check if export directory has contents and force is False
-    if os.path.exists(options.output_data_dir) and os.listdir(options.output_data_dir) and not options.force_export:
+    if not options.force_export and dir_has_contents(options.output_data_dir):
         logger.info(f"Export directory {options.output_data_dir} already has contents and FORCE_EXPORT is False. Skipping batch export.")
         return True
     
@@ -4,15 +4,47 @@ import os
 import time
 import zipfile
 import shutil
+import hashlib
+import gzip
 from pathlib import Path
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 import json
-from typing import Optional, Union, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Union, List, Tuple, Dict
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from loguru import logger
 
+RELEASE_CACHE_TTL = 24 * 60 * 60  # seconds to reuse a cached GitHub release response
+MAX_JSON_RESPONSE_SIZE = 10 * 1024 * 1024  # bytes read from an API response before giving up on parsing it
+
+SCRIPT_DIR = Path(__file__).parent
+TEMP_DIR = Path.cwd() / ".temp"
+CACHE_DIR = Path.cwd() / ".cache"
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # bytes per read while downloading
+DOWNLOAD_PROGRESS_INTERVAL = 0.5  # seconds between download progress log lines
+
+
+class _ProgressWriter:
+    """Wraps a writable file and logs download progress as data is written through it."""
+    
+    def __init__(self, file, total_size: int) -> None:
+        self._file = file
+        self._total_size = total_size
+        self._last_log = time.monotonic()
+        self.written = 0
+    
+    def write(self, data: bytes) -> int:
+        written = self._file.write(data)
+        self.written += written
+        now = time.monotonic()
+        if self._total_size > 0 and now - self._last_log >= DOWNLOAD_PROGRESS_INTERVAL:
+            self._last_log = now
+            logger.opt(lazy=True).debug("Download progress: {}", lambda: f"{(self.written / self._total_size) * 100:.1f}% ({self.written}/{self._total_size} bytes)")
+        return written
+
 
 class DependencyManager:
     """
@@ -22,10 +54,18 @@ class DependencyManager:
     to specified output directories with proper validation and cleanup.
     """
     
-    def __init__(self) -> None:
-        """Initialize the dependency manager."""
-        self.temp_dir = Path.cwd() / ".temp"
-        self.temp_dir.mkdir(exist_ok=True)
+    def __init__(self, subdir: Optional[str] = None) -> None:
+        """
+        Initialize the dependency manager.
+        
+        Args:
+            subdir (str, optional): Subdirectory of the temp dir to download into, so
+                managers running concurrently don't clean up each other's files
+        """
+        self.temp_dir = TEMP_DIR / subdir if subdir else TEMP_DIR
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = CACHE_DIR / "github"
+        self.download_cache_dir = CACHE_DIR / "downloads"
     
     def _get_installed_version(self, output_path: Union[str, Path]) -> Optional[str]:
         """
@@ -61,7 +101,7 @@ class DependencyManager:
         except Exception as e:
             logger.warning(f"Could not write version file: {e}")
     
-    def download_and_extract(self, download_url: str, output_path: Union[str, Path], executable_name: Optional[str] = None, create_output_dir: bool = True, version: Optional[str] = None) -> bool:
+    def download_and_extract(self, download_url: str, output_path: Union[str, Path], executable_name: Optional[str] = None, create_output_dir: bool = True, version: Optional[str] = None, installed_version: Optional[str] = None, force: bool = False) -> bool:
         """
         Download a ZIP file from a URL and extract it to the specified path.
         
@@ -71,6 +111,8 @@ class DependencyManager:
             executable_name (str, optional): Name of main executable to verify after extraction
             create_output_dir (bool): Whether to create the output directory if it doesn't exist
             version (str, optional): Version string to write to version.txt file
+            installed_version (str, optional): Currently installed version if the caller already read it
+            force (bool): Install even if the same version or executable is already present
             
         Returns:
             bool: True if successful, False otherwise
@@ -79,7 +121,7 @@ class DependencyManager:
             Exception: If download or extraction fails
         """
         start_time = time.time()
-        logger.debug(f"Dependency download timer started at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time))}")
+        logger.opt(lazy=True).debug("Dependency download timer started at {}", lambda: time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time)))
         
         output_path = Path(output_path)
         
@@ -91,8 +133,9 @@ class DependencyManager:
             
             # Check if we should skip installation based on version
             if version:
-                installed_version = self._get_installed_version(output_path)
-                if installed_version == version:
+                if installed_version is None:
+                    installed_version = self._get_installed_version(output_path)
+                if installed_version == version and not force:
                     logger.info(f"Version {version} already installed, skipping download")
                     return True
                 elif installed_version:
@@ -101,43 +144,43 @@ class DependencyManager:
                     logger.info(f"Installing version {version} (no previous version found)")
             
             # Check if executable already exists (fallback if no version provided)
-            elif executable_name and (output_path / executable_name).exists():
+            elif executable_name and not force and (output_path / executable_name).exists():
                 logger.info(f"Executable {executable_name} already exists at: {output_path / executable_name}")
                 logger.info("To reinstall, delete the executable and run this again.")
                 return True
             
-            # Download the file
-            zip_filename = self._get_filename_from_url(download_url)
-            zip_path = self.temp_dir / zip_filename
+            # Download the file, unless the same archive was already downloaded by a previous run
+            zip_path = self._get_download_cache_path(download_url)
             
             logger.info(f"Downloading from: {download_url}")
             logger.info(f"Output directory: {output_path}")
             
+            zip_path.parent.mkdir(parents=True, exist_ok=True)
             self._download_file(download_url, zip_path)
             
-            # Validate the downloaded file
-            if not self._validate_zip_file(zip_path):
-                raise Exception("Downloaded file is not a valid ZIP archive")
+            # Anything this small is an error page, not an archive; ZipFile reports other corruption
+            file_size = zip_path.stat().st_size
+            if file_size < 1000:
+                raise Exception(f"Downloaded file is too small ({file_size} bytes), likely an error page")
             
             # Extract the file
             logger.info("Extracting files...")
-            self._extract_zip(zip_path, output_path)
+            extracted_files = self._extract_zip(zip_path, output_path)
             
             # Verify extraction
             if executable_name:
-                self._verify_executable(output_path, executable_name)
+                self._verify_executable(output_path, executable_name, extracted_files)
             
             # Write version file if version provided
             if version:
                 self._write_version_file(output_path, version)
             
-            # Cleanup
-            zip_path.unlink()
-            logger.info("Cleaned up temporary files")
+            # Keep this archive for reuse, drop older downloads of the same asset
+            self._prune_download_cache(zip_path)
             
             end_time = time.time()
             elapsed_time = end_time - start_time
-            logger.debug(f"Dependency download timer ended at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(end_time))}")
+            logger.opt(lazy=True).debug("Dependency download timer ended at {}", lambda: time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(end_time)))
             logger.debug(f"Total dependency download time: {elapsed_time:.2f} seconds ({elapsed_time/60:.2f} minutes)")
             
             logger.success("Dependency installed successfully!")
@@ -146,16 +189,17 @@ class DependencyManager:
         except Exception as e:
             end_time = time.time()
             elapsed_time = end_time - start_time
-            logger.debug(f"Dependency download timer ended (with error) at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(end_time))}")
+            logger.opt(lazy=True).debug("Dependency download timer ended (with error) at {}", lambda: time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(end_time)))
             logger.debug(f"Dependency download time before error: {elapsed_time:.2f} seconds ({elapsed_time/60:.2f} minutes)")
             
             logger.error(f"Failed to install dependency: {e}")
             # Cleanup on failure
-            if 'zip_path' in locals() and zip_path.exists():
-                zip_path.unlink()
+            if 'zip_path' in locals():
+                zip_path.unlink(missing_ok=True)
+                self._get_etag_path(zip_path).unlink(missing_ok=True)
             raise
     
-    def download_github_release_latest(self, repo_owner: str, repo_name: str, asset_pattern: Union[str, List[str]], output_path: Union[str, Path], executable_name: Optional[str] = None, force: bool = False) -> bool:
+    def download_github_release_latest(self, repo_owner: str, repo_name: str, asset_pattern: Union[str, List[str]], output_path: Union[str, Path], executable_name: Optional[str] = None, force: bool = False, use_cache: bool = True) -> bool:
         """
         Download the latest release from a GitHub repository.
         
@@ -166,6 +210,7 @@ class DependencyManager:
             output_path (str or Path): Directory to extract to
             executable_name (str, optional): Name of main executable to verify
             force (bool): Force download even if same version exists
+            use_cache (bool): Reuse a cached release info response younger than RELEASE_CACHE_TTL
             
         Returns:
             bool: True if successful, False otherwise
@@ -177,14 +222,14 @@ class DependencyManager:
             api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
             logger.info(f"Fetching latest release info from: {api_url}")
             
-            release_info = self._get_json_from_url(api_url)
+            release_info = self._get_json_from_url_cached(api_url, ttl=RELEASE_CACHE_TTL if use_cache else 0)
             version = release_info.get('tag_name', 'unknown')
             
             logger.info(f"Latest version: {version}")
             
             # Check if we already have this version (unless force is True)
+            current_version = self._get_installed_version(output_path)
             if not force:
-                current_version = self._get_installed_version(output_path)
                 if current_version == version:
                     logger.info(f"Version {version} already installed. Skipping download.")
                     return True
@@ -201,36 +246,45 @@ class DependencyManager:
             patterns = asset_pattern if isinstance(asset_pattern, list) else [asset_pattern]
             
             for pattern in patterns:
-                for asset in assets:
-                    if pattern in asset['name']:
-                        matching_assets.append(asset)
-                        logger.info(f"Found matching asset: {asset['name']} (pattern: {pattern})")
-                        break
-                else:
-                    # This pattern didn't match any asset
+                # First asset whose name contains the pattern
+                asset = next((asset for asset in assets if pattern in asset['name']), None)
+                if asset is None:
                     logger.warning(f"No asset found matching pattern: {pattern}")
+                    continue
+                matching_assets.append(asset)
+                logger.info(f"Found matching asset: {asset['name']} (pattern: {pattern})")
             
             if not matching_assets:
                 raise Exception(f"No assets found matching patterns: {patterns}")
             
-            # Download and extract all matching assets
+            # Download and extract all matching assets concurrently. Single files are staged in the
+            # temp dir and only moved into output_path once every asset succeeded, so they can't land
+            # in the output root while an archive is being extracted there.
             success = True
-            for asset in matching_assets:
-                download_url = asset['browser_download_url']
-                logger.info(f"Processing asset: {asset['name']}")
-                
-                try:
-                    # For non-ZIP files (like README.md), just download them directly
-                    if not asset['name'].lower().endswith('.zip'):
-                        self._download_single_file(download_url, output_path / asset['name'])
-                    else:
-                        # For ZIP files, use the existing extraction logic
-                        result = self.download_and_extract(download_url, output_path, executable_name, version=version)
-                        if not result:
-                            success = False
-                except Exception as e:
-                    logger.error(f"Failed to process asset {asset['name']}: {e}")
-                    success = False
+            staged_files = []
+            with ThreadPoolExecutor(max_workers=min(4, len(matching_assets))) as executor:
+                futures = {
+                    executor.submit(self._process_asset, asset, output_path, executable_name, version, current_version, force): asset
+                    for asset in matching_assets
+                }
+                for future in as_completed(futures):
+                    asset = futures[future]
+                    try:
+                        staged_file = future.result()
+                        if staged_file:
+                            staged_files.append(staged_file)
+                    except Exception as e:
+                        logger.error(f"Failed to process asset {asset['name']}: {e}")
+                        success = False
+            
+            if not success:
+                # Don't pair new files with an archive that failed to install; the temp dir gets cleaned up by the caller
+                if staged_files:
+                    logger.warning(f"Not installing {', '.join(f.name for f in staged_files)} because another asset failed")
+            elif staged_files:
+                output_path.mkdir(parents=True, exist_ok=True)
+                for staged_file in staged_files:
+                    shutil.move(str(staged_file), str(output_path / staged_file.name))
             
             return success
             
@@ -238,6 +292,41 @@ class DependencyManager:
             logger.error(f"Failed to download latest release: {e}")
             raise
     
+    def _process_asset(self, asset: dict, output_path: Path, executable_name: Optional[str], version: str, installed_version: Optional[str], force: bool) -> Optional[Path]:
+        """
+        Download a single release asset.
+        
+        ZIP assets are extracted straight into output_path. Any other asset is downloaded
+        into the temp dir and its staged path is returned for the caller to move into place.
+
+        Args:
+            asset (dict): Asset entry from the GitHub release info
+            output_path (Path): Directory to extract ZIP assets to
+            executable_name (str, optional): Name of main executable to verify
+            version (str): Release version being installed
+            installed_version (str, optional): Currently installed version
+            force (bool): Force download even if same version exists
+
+        Returns:
+            Path or None: Staged file path for non-ZIP assets, None for ZIP assets
+            
+        Raises:
+            Exception: If the download or extraction fails
+        """
+        download_url = asset['browser_download_url']
+        logger.info(f"Processing asset: {asset['name']}")
+        
+        # For non-ZIP files (like README.md), just download them directly
+        if not asset['name'].lower().endswith('.zip'):
+            staged_file = self.temp_dir / asset['name']
+            self._download_single_file(download_url, staged_file)
+            return staged_file
+        
+        # For ZIP files, use the existing extraction logic
+        if not self.download_and_extract(download_url, output_path, executable_name, version=version, installed_version=installed_version, force=force):
+            raise Exception("Extraction reported failure")
+        return None
+    
     def _download_single_file(self, url: str, output_path: Path) -> None:
         """
         Download a single file (non-ZIP) from URL to output path.
@@ -257,7 +346,7 @@ class DependencyManager:
             
             with urlopen(req) as response:
                 with open(output_path, 'wb') as f:
-                    f.write(response.read())
+                    shutil.copyfileobj(response, f, length=DOWNLOAD_CHUNK_SIZE)
             
             file_size = output_path.stat().st_size
             logger.info(f"Downloaded {output_path.name} ({file_size} bytes)")
@@ -269,75 +358,173 @@ class DependencyManager:
         """Extract filename from URL."""
         return Path(url).name or "download.zip"
     
+    def _get_download_cache_path(self, url: str) -> Path:
+        """
+        Get the path a download is cached at, keyed by its URL and suffixed with its filename.
+        
+        Downloads are grouped in a subdirectory per source, the URL without its last two parts.
+        For GitHub release assets that is the repo, since only the tag and filename differ
+        between its releases, so same-named assets of different repos never share a directory.
+        """
+        source_hash = hashlib.sha1(url.rsplit('/', 2)[0].encode()).hexdigest()[:16]
+        url_hash = hashlib.sha1(url.encode()).hexdigest()[:16]
+        return self.download_cache_dir / source_hash / f"{url_hash}_{self._get_filename_from_url(url)}"
+    
+    def _get_etag_path(self, cached_file: Path) -> Path:
+        """Get the path the ETag of a cached download is stored at."""
+        return cached_file.with_name(cached_file.name + '.etag')
+    
+    def _prune_download_cache(self, keep_file: Path) -> None:
+        """Remove cached downloads of the same file from the same source, e.g. older release versions."""
+        filename = keep_file.name.split('_', 1)[1]
+        keep_files = (keep_file, self._get_etag_path(keep_file))
+        for cached_file in keep_file.parent.iterdir():
+            if cached_file not in keep_files and cached_file.name.split('_', 1)[-1] in (filename, filename + '.etag'):
+                cached_file.unlink()
+                logger.debug(f"Removed outdated cached download {cached_file.name}")
+    
     def _download_file(self, url: str, output_path: Path) -> None:
-        """Download a file from URL to local path."""
+        """
+        Download a file from URL to local path.
+        
+        If output_path already holds an earlier download of the same URL, the request is made
+        conditional on its ETag, so an unchanged file is kept instead of downloaded again.
+        """
+        etag_path = self._get_etag_path(output_path)
+        
+        # Create request with user agent to avoid GitHub API restrictions
+        headers = {'User-Agent': 'WRFrontiers-Exporter'}
+        if output_path.exists() and etag_path.exists():
+            headers['If-None-Match'] = etag_path.read_text().strip()
+        
         try:
             logger.info(f"Downloading file...")
             
-            # Create request with user agent to avoid GitHub API restrictions
-            req = Request(url, headers={'User-Agent': 'WRFrontiers-Exporter'})
+            req = Request(url, headers=headers)
             
             with urlopen(req) as response:
                 file_size = int(response.headers.get('Content-Length', 0))
                 
+                # Drop the old ETag first so an interrupted download is never mistaken for a complete one
+                etag_path.unlink(missing_ok=True)
                 with open(output_path, 'wb') as f:
-                    downloaded = 0
-                    chunk_size = 8192
-                    
-                    while True:
-                        chunk = response.read(chunk_size)
-                        if not chunk:
-                            break
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if file_size > 0:
-                            progress = (downloaded / file_size) * 100
-                            if downloaded % (chunk_size * 100) == 0:  # Log every ~800KB
-                                logger.debug(f"Download progress: {progress:.1f}% ({downloaded}/{file_size} bytes)")
+                    shutil.copyfileobj(response, _ProgressWriter(f, file_size), length=DOWNLOAD_CHUNK_SIZE)
+                
+                etag = response.headers.get('ETag')
+                if etag:
+                    etag_path.write_text(etag)
             
             actual_size = output_path.stat().st_size
             logger.info(f"Downloaded {output_path.name} ({actual_size} bytes)")
             
-        except (URLError, HTTPError) as e:
+        except HTTPError as e:
+            if e.code == 304 and 'If-None-Match' in headers:
+                logger.info(f"Reusing previously downloaded {output_path.name}, unchanged on the server")
+                return
+            raise Exception(f"Failed to download file: {e}")
+        except URLError as e:
             raise Exception(f"Failed to download file: {e}")
     
-    def _get_json_from_url(self, url: str) -> dict:
-        """Get JSON data from URL."""
+    def _get_json_from_url(self, url: str, etag: Optional[str] = None) -> Tuple[Optional[dict], Optional[str]]:
+        """
+        Get JSON data from URL.
+        
+        Args:
+            url (str): URL to fetch JSON from
+            etag (str, optional): ETag of a previously fetched copy, sent as If-None-Match
+            
+        Returns:
+            tuple: (data, etag) - data is None if the server replied 304 Not Modified
+        """
         try:
-            req = Request(url, headers={'User-Agent': 'WRFrontiers-Exporter'})
+            headers = {
+                'User-Agent': 'WRFrontiers-Exporter',
+                'Accept': 'application/vnd.github+json',
+                'Accept-Encoding': 'gzip',
+                'X-GitHub-Api-Version': '2022-11-28',
+            }
+            if etag:
+                headers['If-None-Match'] = etag
+            # Authenticated requests get 5000/hour instead of 60/hour per IP
+            token = os.environ.get('GITHUB_TOKEN')
+            if token:
+                headers['Authorization'] = f'Bearer {token}'
+            req = Request(url, headers=headers)
             with urlopen(req) as response:
-                return json.loads(response.read().decode())
-        except (URLError, HTTPError, json.JSONDecodeError) as e:
+                remaining = response.headers.get('X-RateLimit-Remaining')
+                if remaining is not None and remaining.isdigit() and int(remaining) < 10:
+                    logger.warning(f"GitHub API rate limit nearly exhausted ({remaining} requests left), set GITHUB_TOKEN to raise it")
+                # urllib doesn't decompress on its own
+                body = response.read(MAX_JSON_RESPONSE_SIZE)
+                if response.headers.get('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
+                return json.loads(body.decode()), response.headers.get('ETag')
+        except HTTPError as e:
+            if etag and e.code == 304:
+                return None, etag
+            raise Exception(f"Failed to fetch JSON from {url}: {e}")
+        except (URLError, OSError, EOFError, json.JSONDecodeError) as e:
             raise Exception(f"Failed to fetch JSON from {url}: {e}")
     
-    def _validate_zip_file(self, zip_path: Path) -> bool:
-        """Validate that the file is a proper ZIP archive."""
-        try:
-            file_size = zip_path.stat().st_size
-            logger.debug(f"Validating ZIP file: {zip_path.name} ({file_size} bytes)")
-            
-            # Check if file is too small (likely an error page)
-            if file_size < 1000:
-                logger.error(f"File is too small ({file_size} bytes), likely an error page")
-                return False
+    def _get_json_from_url_cached(self, url: str, ttl: int = RELEASE_CACHE_TTL) -> dict:
+        """
+        Get JSON data from URL, reusing the copy cached on disk if it is younger than ttl.
+        
+        Once the cached copy is stale it is revalidated with its ETag, so an unchanged
+        response costs a 304 with no body instead of a full download.
+        
+        Args:
+            url (str): URL to fetch JSON from
+            ttl (int): Maximum age of the cached copy in seconds. 0 always revalidates.
             
-            # Test if it's a valid ZIP file
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                # Try to read the file list
-                file_list = zf.namelist()
-                logger.debug(f"ZIP contains {len(file_list)} files")
-                return True
-                
-        except zipfile.BadZipFile:
-            logger.error("File is not a valid ZIP archive")
-            return False
-        except Exception as e:
-            logger.error(f"Error validating ZIP file: {e}")
-            return False
+        Returns:
+            dict: Parsed JSON data
+        """
+        cache_file = self.cache_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+        etag_file = cache_file.with_suffix(".etag")
+        cached_data = None
+        try:
+            age = time.time() - cache_file.stat().st_mtime
+            cached_data = json.loads(cache_file.read_text())
+            if age < ttl:
+                logger.debug(f"Using cached response for {url} from {cache_file}")
+                return cached_data
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read cache file {cache_file}: {e}")
+        
+        etag = None
+        if cached_data is not None and etag_file.exists():
+            etag = etag_file.read_text().strip()
+        
+        data, etag = self._get_json_from_url(url, etag=etag)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if data is None:
+                logger.debug(f"Response for {url} not modified, reusing {cache_file}")
+                cache_file.touch()
+                return cached_data
+            cache_file.write_text(json.dumps(data))
+            if etag:
+                etag_file.write_text(etag)
+            elif etag_file.exists():
+                etag_file.unlink()
+        except OSError as e:
+            logger.warning(f"Could not write cache file {cache_file}: {e}")
+        return data if data is not None else cached_data
     
-    def _extract_zip(self, zip_path: Path, output_path: Path) -> None:
-        """Extract ZIP file to output directory."""
+    def _extract_zip(self, zip_path: Path, output_path: Path) -> Dict[str, Path]:
+        """
+        Extract ZIP file to output directory.
+        
+        macOS metadata entries are skipped. If every entry sits under one top-level
+        directory, that directory is stripped so files are written to their final
+        location directly instead of being moved up afterwards.
+        
+        Returns:
+            dict: Extracted file name -> extracted path, first occurrence of each name wins
+        """
         try:
             with zipfile.ZipFile(zip_path, 'r') as zf:
                 # Log contents
@@ -348,55 +535,77 @@ class DependencyManager:
                 if len(file_list) > 10:
                     logger.debug(f"  ... and {len(file_list) - 10} more files")
                 
-                # Extract all files
-                zf.extractall(output_path)
+                members = [info for info in zf.infolist() if not self._is_junk_zip_entry(info.filename)]
+                prefix = self._get_common_zip_prefix(members)
                 
-                # Flatten structure if everything is in a single subdirectory
-                self._flatten_extraction(output_path)
+                if prefix:
+                    # Everything is in a single subdirectory, extract its contents to the root
+                    logger.debug(f"Stripping single top-level directory: {prefix}")
+                    for info in members:
+                        info.filename = info.filename[len(prefix):]
+                        if info.filename:
+                            zf.extract(info, output_path)
+                else:
+                    zf.extractall(output_path, members=members)
+                
+                logger.info(f"Extracted {len(members)} files to {output_path}")
                 
-                logger.info(f"Extracted {len(file_list)} files to {output_path}")
+                extracted_files = {}
+                for info in members:
+                    if info.filename and not info.is_dir():
+                        extracted_files.setdefault(info.filename.rsplit('/', 1)[-1], output_path / info.filename)
+                return extracted_files
                 
+        except zipfile.BadZipFile as e:
+            raise Exception(f"Failed to extract ZIP file: not a valid ZIP archive ({e})")
         except Exception as e:
             raise Exception(f"Failed to extract ZIP file: {e}")
     
-    def _flatten_extraction(self, output_path: Path) -> None:
+    def _is_junk_zip_entry(self, filename: str) -> bool:
+        """Check if a ZIP entry is macOS metadata that shouldn't be extracted."""
+        return filename.startswith('__MACOSX/') or filename.rsplit('/', 1)[-1] == '.DS_Store'
+    
+    def _get_common_zip_prefix(self, members: List[zipfile.ZipInfo]) -> Optional[str]:
         """
-        If extraction created a single subdirectory containing all files,
-        move the files up to the main output directory.
+        Get the top-level directory shared by all ZIP entries.
+        
+        Returns:
+            str or None: The shared directory including its trailing slash, or None if
+            the entries don't all sit under a single top-level directory
         """
-        subdirs = [d for d in output_path.iterdir() if d.is_dir()]
-        files = [f for f in output_path.iterdir() if f.is_file()]
+        top_level_dirs = set()
+        for info in members:
+            top_level, separator, _ = info.filename.partition('/')
+            if not separator:
+                return None
+            top_level_dirs.add(top_level)
         
-        # If there's exactly one subdirectory and no files in root, flatten it
-        if len(subdirs) == 1 and len(files) == 0:
-            subdir = subdirs[0]
-            logger.debug(f"Flattening single subdirectory: {subdir.name}")
-            
-            # Move all files from subdirectory to parent
-            for item in subdir.iterdir():
-                dest = output_path / item.name
-                if dest.exists():
-                    if dest.is_dir():
-                        shutil.rmtree(dest)
-                    else:
-                        dest.unlink()
-                shutil.move(str(item), str(dest))
-            
-            # Remove empty subdirectory
-            subdir.rmdir()
-            logger.debug("Flattened directory structure")
+        if len(top_level_dirs) != 1:
+            return None
+        return f"{top_level_dirs.pop()}/"
     
-    def _verify_executable(self, output_path: Path, executable_name: str) -> None:
-        """Verify that the expected executable was extracted."""
+    def _verify_executable(self, output_path: Path, executable_name: str, extracted_files: Optional[Dict[str, Path]] = None) -> None:
+        """
+        Verify that the expected executable was extracted.
+        
+        Args:
+            output_path (Path): Directory the archive was extracted to
+            executable_name (str): Name of the executable to verify
+            extracted_files (dict, optional): File name -> path index returned by _extract_zip,
+                checked before falling back to searching subdirectories
+        """
         executable_path = output_path / executable_name
         
         if not executable_path.exists():
-            # Search for the executable in subdirectories
-            found_executables = list(output_path.rglob(executable_name))
-            if found_executables:
+            src = extracted_files.get(executable_name) if extracted_files else None
+            if src is None or not src.exists():
+                # Archives usually nest the executable one level down, so check there before a full search
+                src = self._find_in_child_dirs(output_path, executable_name)
+            if src is None:
+                src = next(output_path.rglob(executable_name), None)
+            if src is not None:
                 # Move the first found executable to the root
-                src = found_executables[0]
-                shutil.move(str(src), str(executable_path))
+                os.replace(src, executable_path)
                 logger.info(f"Moved executable from {src.relative_to(output_path)} to root")
             else:
                 raise Exception(f"Executable {executable_name} not found after extraction")
@@ -408,11 +617,36 @@ class DependencyManager:
         if hasattr(os, 'chmod'):
             executable_path.chmod(0o755)
     
+    def _find_in_child_dirs(self, output_path: Path, file_name: str) -> Optional[Path]:
+        """
+        Look for a file directly inside the immediate subdirectories of output_path.
+        
+        Args:
+            output_path (Path): Directory whose subdirectories to check
+            file_name (str): Name of the file to look for
+            
+        Returns:
+            Path: Path of the first match, or None if no subdirectory contains the file
+        """
+        with os.scandir(output_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    candidate = Path(entry.path) / file_name
+                    if candidate.is_file():
+                        return candidate
+        return None
+    
     def cleanup_temp_files(self) -> None:
         """Clean up temporary download directory."""
         if self.temp_dir.exists():
             shutil.rmtree(self.temp_dir)
             logger.debug("Cleaned up temporary download directory")
+        if self.temp_dir != TEMP_DIR:
+            # Remove the shared parent once the last manager using it is done
+            try:
+                TEMP_DIR.rmdir()
+            except OSError:
+                pass
 
 
 def install_batch_export(output_path: Optional[Union[str, Path]] = None, force: bool = False) -> bool:
@@ -424,10 +658,9 @@ def install_batch_export(output_path: Optional[Union[str, Path]] = None, force:
         force (bool): Force download even if same version exists
     """
     if output_path is None:
-        script_dir = Path(__file__).parent
-        output_path = script_dir / "batch_export" / "BatchExport"
+        output_path = SCRIPT_DIR / "batch_export" / "BatchExport"
     
-    dm = DependencyManager()
+    dm = DependencyManager(subdir="BatchExport")
     try:
         return dm.download_github_release_latest(
             repo_owner="Surxe",
@@ -435,7 +668,8 @@ def install_batch_export(output_path: Optional[Union[str, Path]] = None, force:
             asset_pattern=["BatchExport-windows-x64.zip", "README.md"],
             output_path=output_path,
             executable_name="BatchExport.exe",
-            force=force
+            force=force,
+            use_cache=not force
         )
     finally:
         dm.cleanup_temp_files()
@@ -450,10 +684,9 @@ def install_depot_downloader(output_path: Optional[Union[str, Path]] = None, for
         force (bool): Force download even if same version exists
     """
     if output_path is None:
-        script_dir = Path(__file__).parent
-        output_path = script_dir / "steam" / "DepotDownloader"
+        output_path = SCRIPT_DIR / "steam" / "DepotDownloader"
     
-    dm = DependencyManager()
+    dm = DependencyManager(subdir="DepotDownloader")
     try:
         return dm.download_github_release_latest(
             repo_owner="SteamRE",
@@ -461,7 +694,8 @@ def install_depot_downloader(output_path: Optional[Union[str, Path]] = None, for
             asset_pattern="windows-x64.zip",
             output_path=output_path,
             executable_name="DepotDownloader.exe",
-            force=force
+            force=force,
+            use_cache=not force
         )
     finally:
         dm.cleanup_temp_files()
@@ -476,21 +710,33 @@ def main(force_download: bool = False) -> bool:
     """
     logger.info("Installing WRFrontiers-Exporter dependencies...")
     
-    try:
-        # Install BatchExport
-        logger.info("Installing BatchExport...")
-        install_batch_export(force=force_download)
+    # The installs target independent repos and output dirs, so download them concurrently
+    installers = {
+        "BatchExport": install_batch_export,
+        "DepotDownloader": install_depot_downloader,
+    }
+    failed = False
+    with ThreadPoolExecutor(max_workers=len(installers)) as executor:
+        futures = {}
+        for name, installer in installers.items():
+            logger.info(f"Installing {name}...")
+            futures[executor.submit(installer, force=force_download)] = name
         
-        # Install DepotDownloader
-        logger.info("Installing DepotDownloader...")
-        install_depot_downloader(force=force_download)
-        
-        logger.success("All dependencies installed successfully!")
-        
-    except Exception as e:
-        logger.error(f"Failed to install dependencies: {e}")
+        for future in as_completed(futures):
+            try:
+                if not future.result():
+                    logger.error(f"Failed to install {futures[future]}")
+                    failed = True
+            except Exception as e:
+                logger.error(f"Failed to install {futures[future]}: {e}")
+                failed = True
+    
+    if failed:
+        logger.error("Failed to install dependencies")
         return False
     
+    logger.success("All dependencies installed successfully!")
+    
     return True
 
 
@@ -2,22 +2,31 @@
 import sys
 import os
 import time
+import glob
 import shutil
-from typing import Optional
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathlib import Path
+from typing import Optional, List, Union
+MAPPER_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(MAPPER_DIR))
 
 from optionsconfig import init_options, Options
-from utils import clear_dir, wait_for_process_ready_for_injection, terminate_process_by_name, terminate_process_object, is_admin
+from utils import clear_dir, wait_for_process_input_idle, wait_for_process_ready_for_injection, terminate_process_by_name, terminate_process_object, is_admin
 from mapper.simple_injector import inject_dll_into_process
 from loguru import logger
 import subprocess
 
+DLL_PATH = os.path.join(MAPPER_DIR, 'Dumper-7.dll')
+SHIPPING_EXE_RELATIVE_PATH = "13_2017027/WRFrontiers/Binaries/Win64/WRFrontiers-Win64-Shipping.exe"
+GAME_MANIFEST_FILE = 'manifest.txt'  # Written by DepotDownloader each time the game is downloaded
+GAME_STARTUP_CHECK_TIME = 2  # Seconds a freshly launched game has to survive before it counts as started
+ENGINE_SETTLE_TIME = 5  # Seconds to let the engine finish loading after the game's window reports it is idle
+
+
 def get_dll_path() -> str:
-    dll_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'mapper', 'Dumper-7.dll')
-    if not os.path.exists(dll_path):
-        raise Exception(f"DLL file not found: {dll_path}")
-    logger.info(f"DLL file confirmed: {dll_path}")
-    return dll_path
+    if not os.path.isfile(DLL_PATH):
+        raise Exception(f"DLL file not found: {DLL_PATH}")
+    logger.info(f"DLL file confirmed: {DLL_PATH}")
+    return DLL_PATH
 
 
 def get_mapping_file_path(options: Optional[Options] = None) -> str:
@@ -54,16 +63,16 @@ def find_existing_mapping_file(dumper7_output_dir: str) -> Optional[str]:
         return None
 
 
-def copy_mapper_file_to_output(source_mapper_path: str, output_mapper_file: str) -> Optional[str]:
+def copy_mapper_file_to_output(source_mapper_path: Union[str, Path], output_mapper_file: Union[str, Path]) -> Optional[Union[str, Path]]:
     """
     Copy a mapper file from source to output location.
     
     Args:
-        source_mapper_path (str): Path to the source mapper file
-        output_mapper_file (str): Full file path where the mapper file should be copied (including filename)
+        source_mapper_path (str | Path): Path to the source mapper file
+        output_mapper_file (str | Path): Full file path where the mapper file should be copied (including filename)
         
     Returns:
-        str: Path to the copied file if successful, None otherwise
+        str | Path: Path to the copied file if successful, None otherwise
     """
     try:
         if not os.path.exists(source_mapper_path):
@@ -74,8 +83,17 @@ def copy_mapper_file_to_output(source_mapper_path: str, output_mapper_file: str)
         parent_dir = os.path.dirname(output_mapper_file)
         os.makedirs(parent_dir, exist_ok=True)
         
-        # Copy the mapper file
-        shutil.copy2(source_mapper_path, output_mapper_file)
+        # Hardlink the mapper file into place to avoid copying its bytes, copy if linking isn't possible
+        temp_output_file = os.fspath(output_mapper_file) + '.tmp'
+        try:
+            os.link(source_mapper_path, temp_output_file)
+            os.replace(temp_output_file, output_mapper_file)
+        except OSError:
+            # Don't leave a half-placed link behind if the swap itself failed
+            if os.path.lexists(temp_output_file):
+                os.remove(temp_output_file)
+            # A freshly dumped mapper has no metadata worth preserving, so skip copy2's copystat
+            shutil.copyfile(source_mapper_path, output_mapper_file)
         logger.info(f"Mapper file copied from {source_mapper_path} to {output_mapper_file}")
         
         return output_mapper_file
@@ -99,33 +117,33 @@ def get_mapper_from_sdk(dumper7_output_dir: str) -> str:
         Exception: If SDK directory structure is invalid or mapper file not found
     """
     # If more than 1 dir (name does not matter) exists in the Dumper-7 output path, throw an error
-    sdk_dirs = [d for d in os.listdir(dumper7_output_dir) if os.path.isdir(os.path.join(dumper7_output_dir, d))]
+    with os.scandir(dumper7_output_dir) as entries:
+        sdk_dirs = [entry.name for entry in entries if entry.is_dir()]
     if len(sdk_dirs) != 1:
         logger.error(f"Expected exactly one directory in Dumper-7 output path, found {len(sdk_dirs)}: {sdk_dirs}")
         raise Exception(f"Invalid SDK directory structure: found {len(sdk_dirs)} directories instead of 1")
     
-    # If exactly one dir, check if the Mappings dir exists within it
+    # If exactly one dir, check if the Mappings dir exists within it and get its files
     mapper_dir = os.path.join(dumper7_output_dir, sdk_dirs[0], 'Mappings')
-    if not os.path.exists(mapper_dir):
+    try:
+        with os.scandir(mapper_dir) as entries:
+            mapper_files = [entry for entry in entries if entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
         logger.error(f"Mappings directory not found in Dumper-7 output: {mapper_dir}")
         raise Exception(f"Mappings directory not found: {mapper_dir}")
     
     logger.info(f"SDK creation appears to have succeeded - found Mappings directory: {mapper_dir}")
     
-    # If mappings dir exists, get the file names
-    mapper_files = [f for f in os.listdir(mapper_dir) if os.path.isfile(os.path.join(mapper_dir, f))]
     if len(mapper_files) == 0:
         logger.error(f"No mapper files found in Mappings directory: {mapper_dir}")
         raise Exception(f"No mapper files found in: {mapper_dir}")
     elif len(mapper_files) > 1:
-        logger.error(f"Multiple mapper files found in Mappings directory, expected only one: {mapper_files}")
-        raise Exception(f"Multiple mapper files found, expected only one: {mapper_files}")
+        mapper_file_names = [entry.name for entry in mapper_files]
+        logger.error(f"Multiple mapper files found in Mappings directory, expected only one: {mapper_file_names}")
+        raise Exception(f"Multiple mapper files found, expected only one: {mapper_file_names}")
     
-    mapper_file_path = os.path.join(mapper_dir, mapper_files[0])
-
-    if not os.path.exists(mapper_file_path):
-        logger.error(f"Mapper file not found at expected location: {mapper_file_path}")
-        raise Exception(f"Mapper file not found: {mapper_file_path}")
+    # The directory entry already proves the file exists
+    mapper_file_path = mapper_files[0].path
 
     logger.info(f"Mapper file successfully created: {mapper_file_path}")
     return mapper_file_path
@@ -147,25 +165,111 @@ def launch_game_process(shipping_cmd_path: str) -> subprocess.Popen:
     game_process = subprocess.Popen(launch_game_options)
     logger.info(f"Game process started with PID: {game_process.pid}")
     
-    # Check if the process started successfully
-    time.sleep(2)  # Give it a moment to start
-    if game_process.poll() is not None:
-        raise Exception(f"Game process failed to start (exit code: {game_process.returncode})")
+    # Check if the process started successfully, reporting a crash as soon as it exits instead of after a fixed sleep.
+    # Anything that survives this gets waited on properly by wait_for_process_ready_for_injection
+    try:
+        game_process.wait(timeout=GAME_STARTUP_CHECK_TIME)
+    except subprocess.TimeoutExpired:
+        return game_process
+    raise Exception(f"Game process failed to start (exit code: {game_process.returncode})")
+
+
+def is_mapper_file_current(mapper_file: str, steam_game_download_dir: str) -> bool:
+    """
+    Check if a mapper file was dumped from the currently installed game build.
+    
+    Args:
+        mapper_file (str): Path to the mapper file
+        steam_game_download_dir (str): Path to the game installation directory
+        
+    Returns:
+        bool: True if the mapper file is newer than the installed game, False if it is older
+            or the game's install time can't be determined
+    """
+    # The downloaded manifest id is rewritten on every game update, fall back to the executable itself
+    game_files = [
+        os.path.join(steam_game_download_dir, GAME_MANIFEST_FILE),
+        os.path.join(steam_game_download_dir, SHIPPING_EXE_RELATIVE_PATH),
+    ]
+    for game_file in game_files:
+        try:
+            game_mtime = os.path.getmtime(game_file)
+        except OSError:
+            continue
+        try:
+            return os.path.getmtime(mapper_file) >= game_mtime
+        except OSError:
+            return False
+    
+    return False
+
+
+def list_mapper_files(dumper7_output_dir: str) -> List[str]:
+    """
+    List files in any Mappings directory of the Dumper-7 output, without validating the SDK layout.
+    
+    Args:
+        dumper7_output_dir (str): Path to the Dumper-7 output directory
+        
+    Returns:
+        list[str]: Paths of the mapper files found, empty if there are none
+    """
+    mapper_glob = os.path.join(glob.escape(dumper7_output_dir), '*', 'Mappings', '*')
+    return [f for f in glob.glob(mapper_glob) if os.path.isfile(f)]
+
+
+def wait_for_mapper_file(dumper7_output_dir: str, timeout: float = 10, poll_interval: float = 0.25, game_process: Optional[subprocess.Popen] = None) -> bool:
+    """
+    Wait for Dumper-7 to finish writing a mapper file into its output directory.
+    
+    Args:
+        dumper7_output_dir (str): Path to the Dumper-7 output directory
+        timeout (float, optional): Maximum time to wait in seconds. Defaults to 10.
+        poll_interval (float, optional): Time between checks in seconds. Defaults to 0.25.
+        game_process (subprocess.Popen, optional): The game process Dumper-7 runs in. If provided,
+            waiting stops as soon as it exits.
+        
+    Returns:
+        bool: True if a mapper file appeared and stopped growing, False if the timeout was reached
+            or the game exited without writing one
+    """
+    deadline = time.monotonic() + timeout
+    last_size = None
     
-    return game_process
+    while time.monotonic() < deadline:
+        mapper_files = list_mapper_files(dumper7_output_dir)
+        if mapper_files:
+            # Only treat the file as done once its size holds steady between two checks
+            try:
+                size = os.path.getsize(mapper_files[0])
+            except OSError:
+                size = None
+            if size and size == last_size:
+                return True
+            last_size = size
+        if game_process is not None and game_process.poll() is not None:
+            # Nothing is left to write the mapper once the game has exited, e.g. after a crash
+            logger.info(f"Game process exited (exit code: {game_process.returncode}) while waiting for the mapper file")
+            return bool(last_size)
+        time.sleep(poll_interval)
+    
+    return False
 
 
-def terminate_game_process(game_process: subprocess.Popen, game_process_name: str) -> None:
+def terminate_game_process(game_process: subprocess.Popen, game_process_name: str, dumper7_output_dir: str) -> None:
     """
     Terminate the game process.
     
     Args:
         game_process (subprocess.Popen): The game process object
         game_process_name (str): Name of the game process
+        dumper7_output_dir (str): Dumper-7 output directory. Termination happens as soon as a
+            mapper file is written there or the game exits, instead of after the full wait.
     """
     wait = 10
-    logger.info(f"Waiting {wait} seconds before terminating game process just in case the dll did inject and just needs time to process...")
-    time.sleep(wait)
+    logger.info(f"Waiting up to {wait} seconds before terminating game process just in case the dll did inject and just needs time to process...")
+    if wait_for_mapper_file(dumper7_output_dir, timeout=wait, game_process=game_process):
+        logger.info("Mapper file written, no need to wait any longer")
 
     # Always try to terminate the game when done
     logger.info("Terminating game process...")
@@ -176,20 +280,32 @@ def terminate_game_process(game_process: subprocess.Popen, game_process_name: st
         terminate_process_by_name(game_process_name)
 
 
-def perform_dll_injection(game_process_name: str, dll_path: str) -> bool:
+def perform_dll_injection(game_process_name: str, dll_path: str, game_process: Optional[subprocess.Popen] = None) -> bool:
     """
     Perform DLL injection into the game process.
     
     Args:
         game_process_name (str): Name of the game process
         dll_path (str): Path to the DLL file
+        game_process (subprocess.Popen, optional): The launched game process. If provided, the OS is
+            asked to signal when it finishes initializing instead of always waiting the full time.
         
     Returns:
         bool: True if injection was successful, False otherwise
     """
     # Wait for the game to be ready for injection
     logger.info("Waiting for game to be ready for DLL injection...")
-    wait_for_process_ready_for_injection(game_process_name, initialization_time=10)
+    initialization_time = 10
+    if game_process is not None:
+        start_time = time.monotonic()
+        if wait_for_process_input_idle(game_process.pid, timeout=initialization_time):
+            # Input idle only means the window's message loop is up, not that the UE objects Dumper-7 walks exist yet
+            logger.info(f"Game reported it finished initializing, letting the engine settle for {ENGINE_SETTLE_TIME} seconds")
+            initialization_time = ENGINE_SETTLE_TIME
+        else:
+            # Only wait for whatever is left of the initialization time
+            initialization_time = max(0, initialization_time - int(time.monotonic() - start_time))
+    wait_for_process_ready_for_injection(game_process_name, initialization_time=initialization_time)
     
     logger.info("Game is ready, starting SDK creation process via DLL injection...")
     
@@ -207,12 +323,26 @@ def main(options: Optional[Options] = None) -> str:
         raise ValueError("Options must be provided")
 
     # Check if mapper file already exists and force is False
-    if os.path.exists(options.output_mapper_file) and not options.force_get_mapper:
-        logger.info(f"Mapper file already exists at {options.output_mapper_file} and FORCE_GET_MAPPER is False. Skipping mapper creation.")
-        return options.output_mapper_file
+    if not options.force_get_mapper:
+        if os.path.isfile(options.output_mapper_file):
+            logger.info(f"Mapper file already exists at {options.output_mapper_file} and FORCE_GET_MAPPER is False. Skipping mapper creation.")
+            return options.output_mapper_file
+        
+        # A previous run may have dumped the SDK without getting as far as copying the mapper out.
+        # Glob first so the usual empty output dir doesn't log SDK layout errors
+        existing_mapping_file_path = None
+        if list_mapper_files(options.dumper7_output_dir):
+            existing_mapping_file_path = find_existing_mapping_file(options.dumper7_output_dir)
+        if existing_mapping_file_path and not is_mapper_file_current(existing_mapping_file_path, options.steam_game_download_dir):
+            # The Dumper-7 output outlives game updates, a dump from an older build would produce wrong exports
+            logger.info(f"Existing mapper file {existing_mapping_file_path} predates the installed game build. Creating a new one.")
+            existing_mapping_file_path = None
+        if existing_mapping_file_path and copy_mapper_file_to_output(existing_mapping_file_path, options.output_mapper_file):
+            logger.info("Reused mapper file from existing Dumper-7 output and FORCE_GET_MAPPER is False. Skipping mapper creation.")
+            return options.output_mapper_file
 
     # Construct shipping executable path from steam download path
-    shipping_cmd_path = os.path.join(options.steam_game_download_dir, "13_2017027/WRFrontiers/Binaries/Win64/WRFrontiers-Win64-Shipping.exe")
+    shipping_cmd_path = os.path.join(options.steam_game_download_dir, SHIPPING_EXE_RELATIVE_PATH)
     
     # Validate that the shipping executable exists
     if not os.path.exists(shipping_cmd_path):
@@ -242,40 +372,36 @@ def main(options: Optional[Options] = None) -> str:
     
     try:
         # Perform DLL injection
-        injection_success = perform_dll_injection(game_process_name, dll_path)
+        injection_success = perform_dll_injection(game_process_name, dll_path, game_process)
         
         if not injection_success:
             raise Exception("DLL injection failed")
 
     # If it says it errors, it may have actually worked. This actually happens every time for me so long as I'm running as administrator, but I don't know why.
     except Exception as e:
-        terminate_game_process(game_process, game_process_name)
+        terminate_game_process(game_process, game_process_name, options.dumper7_output_dir)
         has_terminated = True
 
         logger.info("DLL injection says it failed, but it could be incorrect. Checking if the mapping file was created...")
-        mapping_file_path = get_mapper_from_sdk(options.dumper7_output_dir)
+        mapping_file_path = find_existing_mapping_file(options.dumper7_output_dir)
         if mapping_file_path is None:
             logger.error("DLL injection failed and mapping file was not created. Cannot continue.")
             raise e
         
     if not has_terminated:
-        terminate_game_process(game_process, game_process_name)
+        terminate_game_process(game_process, game_process_name, options.dumper7_output_dir)
 
     if mapping_file_path is None:
-        # If we didn't already get the mapper file path from the exception handler, try to get it now 
+        # Only scan here if the exception handler didn't already find the mapper file
         mapping_file_path = get_mapper_from_sdk(options.dumper7_output_dir)
 
     # Copy the mapper file to the output path with the desired filename
     if not mapping_file_path:
         raise Exception("Mapper file path could not be determined after SDK creation")
     
-    # Ensure the parent directory exists
-    parent_dir = os.path.dirname(options.output_mapper_file)
-    os.makedirs(parent_dir, exist_ok=True)
-    
     # Copy the mapper file to the specified path and filename
     # This will use the filename from optionsconfig.output_mapper_file, not the original extracted filename
-    shutil.copy2(mapping_file_path, options.output_mapper_file)
-    logger.info(f"Mapper file copied from {mapping_file_path} to {options.output_mapper_file}")
+    if copy_mapper_file_to_output(mapping_file_path, options.output_mapper_file) is None:
+        raise Exception(f"Failed to copy mapper file to {options.output_mapper_file}")
 
     return options.output_mapper_file
\ No newline at end of file
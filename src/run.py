@@ -30,6 +30,8 @@ from optionsconfig import init_options, ArgumentWriter, Options
 import traceback
 from dependency_manager import main as dependency_main
 
+LOG_DIR = Path('logs')
+
 
 def run_dependency_manager(options: Options) -> bool:
     """
@@ -362,16 +364,13 @@ def get_log_file_path(args: Namespace) -> Optional[str]:
     Returns:
         Path: Log file path
     """
-    if hasattr(args, 'steam_game_download_dir') and args.steam_game_download_dir:
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    steam_game_download_dir = getattr(args, 'steam_game_download_dir', None)
+    if steam_game_download_dir:
         # path/to/steamdownload/2025-09-30
         # output to cwd/logs/2025-09-30.log
-        steam_dir = Path(args.steam_game_download_dir)
-        version_date = steam_dir.name
-        log_dir = Path('logs')
-        log_dir.mkdir(parents=True, exist_ok=True)
-        log_file = log_dir / f"{version_date}.log"
-        return Path(log_file)
-    return Path('logs/default.log')
+        return LOG_DIR / f"{Path(steam_game_download_dir).name}.log"
+    return LOG_DIR / 'default.log'
 
 
 if __name__ == "__main__":
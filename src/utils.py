@@ -21,6 +21,14 @@ def clear_dir(dir_path: str) -> None:
         else:
             os.remove(item_path)
 
+def dir_has_contents(dir_path: str) -> bool:
+    """Check if a directory exists and contains at least one entry, without listing all of them"""
+    try:
+        with os.scandir(dir_path) as entries:
+            return next(entries, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
 def normalize_path(path: str) -> str:
     """Normalize a file path to use forward slashes for cross-platform consistency."""
     # Use os.path.normpath to normalize the path properly for the current platform
@@ -265,6 +273,38 @@ def is_admin() -> bool:
     except:
         return False
 
+def wait_for_process_input_idle(pid: int, timeout: int = 10) -> bool:
+    """Wait for a process to finish initializing and sit idle waiting for user input
+    
+    Uses the WaitForInputIdle Win32 API, so the OS wakes us as soon as the process is ready
+    instead of sleeping for a fixed time.
+    
+    Args:
+        pid (int): The PID of the process to wait for
+        timeout (int, optional): Maximum time to wait in seconds. Defaults to 10.
+    
+    Returns:
+        bool: True if the process became idle, False on timeout, on failure (e.g. the process has no
+            message loop), or on non-Windows systems
+    """
+    if os.name != 'nt':
+        return False
+    
+    import ctypes
+    
+    PROCESS_QUERY_INFORMATION = 0x0400
+    SYNCHRONIZE = 0x00100000
+    
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.OpenProcess(PROCESS_QUERY_INFORMATION | SYNCHRONIZE, False, pid)
+    if not handle:
+        return False
+    try:
+        # Returns 0 once idle, WAIT_TIMEOUT or WAIT_FAILED otherwise
+        return ctypes.windll.user32.WaitForInputIdle(handle, timeout * 1000) == 0
+    finally:
+        kernel32.CloseHandle(handle)
+
 def wait_for_process_ready_for_injection(process_name: str, initialization_time: int = 30) -> int:
     """Wait for a process to be ready for DLL injection
     
@@ -294,7 +334,9 @@ def wait_for_process_ready_for_injection(process_name: str, initialization_time:
     check_interval = 5  # check every 5 seconds
     
     for i in range(0, initialization_time, check_interval):
-        time.sleep(check_interval)
+        # The last chunk only sleeps for whatever is left of the initialization time
+        step = min(check_interval, initialization_time - i)
+        time.sleep(step)
         
         # Verify process is still running
         if os.name == 'nt':
@@ -306,7 +348,7 @@ def wait_for_process_ready_for_injection(process_name: str, initialization_time:
             except subprocess.CalledProcessError:
                 raise Exception(f"Failed to check if process {process_name} is still running")
         
-        elapsed = i + check_interval
+        elapsed = i + step
         logger.info(f"Initialization progress: {elapsed}/{initialization_time} seconds...")
     
     logger.info(f"Process {process_name} should now be ready for injection")
@@ -2,6 +2,7 @@ import unittest
 import os
 import tempfile
 import shutil
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
@@ -83,10 +84,67 @@ class TestCopyMapperFileToOutput(unittest.TestCase):
         self.assertIn(self.source_file, info_msg)
         self.assertIn(self.output_file, info_msg)
     
-    @patch('shutil.copy2')
+    def test_copy_mapper_file_hardlinks_when_possible(self):
+        """Test that copy_mapper_file_to_output links the output to the source instead of copying"""
+        result = copy_mapper_file_to_output(self.source_file, self.output_file)
+        
+        self.assertEqual(result, self.output_file)
+        self.assertTrue(os.path.samefile(self.source_file, self.output_file))
+        self.assertFalse(os.path.exists(self.output_file + '.tmp'))
+    
+    def test_copy_mapper_file_accepts_path_objects(self):
+        """Test that copy_mapper_file_to_output works with Path arguments, as options provide them"""
+        source_file = Path(self.source_file)
+        output_file = Path(self.output_file)
+        
+        result = copy_mapper_file_to_output(source_file, output_file)
+        
+        self.assertEqual(result, output_file)
+        self.assertTrue(os.path.samefile(source_file, output_file))
+        self.assertFalse(os.path.exists(self.output_file + '.tmp'))
+    
+    @patch('os.link')
+    def test_copy_mapper_file_falls_back_to_copy(self, mock_link):
+        """Test that copy_mapper_file_to_output copies when hardlinking is not possible"""
+        mock_link.side_effect = OSError("Cross-device link")
+        
+        result = copy_mapper_file_to_output(self.source_file, self.output_file)
+        
+        self.assertEqual(result, self.output_file)
+        self.assertFalse(os.path.samefile(self.source_file, self.output_file))
+        with open(self.output_file, 'r') as f:
+            self.assertEqual(f.read(), "test mapper content")
+    
+    @patch('os.link')
+    def test_copy_mapper_file_falls_back_to_copy_with_path_objects(self, mock_link):
+        """Test that the copy fallback also works with Path arguments"""
+        mock_link.side_effect = OSError("Cross-device link")
+        output_file = Path(self.output_file)
+        
+        result = copy_mapper_file_to_output(Path(self.source_file), output_file)
+        
+        self.assertEqual(result, output_file)
+        self.assertFalse(os.path.samefile(self.source_file, output_file))
+        self.assertEqual(output_file.read_text(), "test mapper content")
+    
+    @patch('os.replace')
+    def test_copy_mapper_file_removes_temp_link_when_replace_fails(self, mock_replace):
+        """Test that a failed swap doesn't leave the temporary link behind"""
+        mock_replace.side_effect = PermissionError("Output file in use")
+        
+        result = copy_mapper_file_to_output(self.source_file, self.output_file)
+        
+        self.assertEqual(result, self.output_file)
+        self.assertFalse(os.path.exists(self.output_file + '.tmp'))
+        with open(self.output_file, 'r') as f:
+            self.assertEqual(f.read(), "test mapper content")
+    
+    @patch('os.link')
+    @patch('shutil.copyfile')
     @patch('mapper.get_mapper.logger')
-    def test_copy_mapper_file_handles_copy_exception(self, mock_logger, mock_copy):
-        """Test copy_mapper_file_to_output handles shutil.copy2 exceptions"""
+    def test_copy_mapper_file_handles_copy_exception(self, mock_logger, mock_copy, mock_link):
+        """Test copy_mapper_file_to_output handles shutil.copyfile exceptions"""
+        mock_link.side_effect = OSError("Cross-device link")
         mock_copy.side_effect = PermissionError("Permission denied")
         
         result = copy_mapper_file_to_output(self.source_file, self.output_file)
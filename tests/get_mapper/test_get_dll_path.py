@@ -21,10 +21,10 @@ class TestGetDllPath(unittest.TestCase):
         """Clean up after each test method."""
         os.chdir(self.original_cwd)
     
-    @patch('os.path.exists')
-    def test_get_dll_path_exists(self, mock_exists):
+    @patch('os.path.isfile')
+    def test_get_dll_path_exists(self, mock_isfile):
         """Test get_dll_path when DLL file exists"""
-        mock_exists.return_value = True
+        mock_isfile.return_value = True
         
         dll_path = get_dll_path()
         
@@ -32,24 +32,24 @@ class TestGetDllPath(unittest.TestCase):
         expected_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'mapper', 'Dumper-7.dll')
         expected_path = expected_path.replace('tests', 'src')
         self.assertTrue(dll_path.endswith('Dumper-7.dll'))
-        mock_exists.assert_called_once()
+        mock_isfile.assert_called_once()
     
-    @patch('os.path.exists')
-    def test_get_dll_path_not_exists(self, mock_exists):
+    @patch('os.path.isfile')
+    def test_get_dll_path_not_exists(self, mock_isfile):
         """Test get_dll_path when DLL file does not exist"""
-        mock_exists.return_value = False
+        mock_isfile.return_value = False
         
         with self.assertRaises(Exception) as context:
             get_dll_path()
         
         self.assertIn("DLL file not found", str(context.exception))
-        mock_exists.assert_called_once()
+        mock_isfile.assert_called_once()
     
-    @patch('os.path.exists')
+    @patch('os.path.isfile')
     @patch('mapper.get_mapper.logger')
-    def test_get_dll_path_logs_confirmation(self, mock_logger, mock_exists):
+    def test_get_dll_path_logs_confirmation(self, mock_logger, mock_isfile):
         """Test that get_dll_path logs DLL confirmation when file exists"""
-        mock_exists.return_value = True
+        mock_isfile.return_value = True
         
         dll_path = get_dll_path()
         
@@ -61,13 +61,13 @@ class TestGetDllPath(unittest.TestCase):
     
     def test_get_dll_path_returns_absolute_path(self):
         """Test that get_dll_path returns an absolute path"""
-        with patch('os.path.exists', return_value=True):
+        with patch('os.path.isfile', return_value=True):
             dll_path = get_dll_path()
             self.assertTrue(os.path.isabs(dll_path))
     
     def test_get_dll_path_correct_filename(self):
         """Test that get_dll_path returns path ending with correct DLL name"""
-        with patch('os.path.exists', return_value=True):
+        with patch('os.path.isfile', return_value=True):
             dll_path = get_dll_path()
             self.assertTrue(dll_path.endswith('Dumper-7.dll'))
 
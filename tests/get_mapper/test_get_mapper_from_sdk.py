@@ -108,30 +108,17 @@ class TestGetMapperFromSdk(unittest.TestCase):
         self.assertIn("Multiple mapper files found", str(context.exception))
         self.assertIn("expected only one", str(context.exception))
     
-    def test_get_mapper_from_sdk_mapper_file_not_exists(self):
-        """Test get_mapper_from_sdk when mapper file path doesn't actually exist"""
-        # This is an edge case where listdir shows file but exists check fails
+    def test_get_mapper_from_sdk_mappings_is_file(self):
+        """Test get_mapper_from_sdk when Mappings is a file instead of a directory"""
         sdk_dir = os.path.join(self.dumper7_output_dir, "TestSDK")
-        mappings_dir = os.path.join(sdk_dir, "Mappings")
-        os.makedirs(mappings_dir)
+        os.makedirs(sdk_dir)
+        with open(os.path.join(sdk_dir, "Mappings"), 'w') as f:
+            f.write("not a directory")
         
-        mapper_file = os.path.join(mappings_dir, "test_mapper.usmap")
-        with open(mapper_file, 'w') as f:
-            f.write("test content")
+        with self.assertRaises(Exception) as context:
+            get_mapper_from_sdk(self.dumper7_output_dir)
         
-        # Mock os.path.exists to return False for the specific mapper file
-        with patch('os.path.exists') as mock_exists:
-            def exists_side_effect(path):
-                if path == mapper_file:
-                    return False
-                return True  # For other paths like directories
-            
-            mock_exists.side_effect = exists_side_effect
-            
-            with self.assertRaises(Exception) as context:
-                get_mapper_from_sdk(self.dumper7_output_dir)
-            
-            self.assertIn("Mapper file not found", str(context.exception))
+        self.assertIn("Mappings directory not found", str(context.exception))
     
     @patch('mapper.get_mapper.logger')
     def test_get_mapper_from_sdk_logs_success(self, mock_logger):
@@ -0,0 +1,68 @@
+import unittest
+import os
+import tempfile
+import shutil
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+# Import from the src directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src')))
+from mapper.get_mapper import is_mapper_file_current, GAME_MANIFEST_FILE, SHIPPING_EXE_RELATIVE_PATH
+
+
+class TestIsMapperFileCurrent(unittest.TestCase):
+    """Test cases for is_mapper_file_current function"""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.test_dir = tempfile.mkdtemp()
+        self.game_dir = os.path.join(self.test_dir, "game")
+        os.makedirs(self.game_dir)
+        self.mapper_file = os.path.join(self.test_dir, "mapper.usmap")
+        with open(self.mapper_file, 'w') as f:
+            f.write("test mapper content")
+    
+    def tearDown(self):
+        """Clean up after each test method."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def create_game_file(self, relative_path, mtime):
+        """Helper method to create a game file with a given modification time"""
+        path = os.path.join(self.game_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write("game file")
+        os.utime(path, (mtime, mtime))
+        return path
+    
+    def test_mapper_newer_than_manifest(self):
+        """Test that a mapper dumped after the game download is current"""
+        self.create_game_file(GAME_MANIFEST_FILE, os.path.getmtime(self.mapper_file) - 100)
+        
+        self.assertTrue(is_mapper_file_current(self.mapper_file, self.game_dir))
+    
+    def test_mapper_older_than_manifest(self):
+        """Test that a mapper dumped before a game update is stale"""
+        self.create_game_file(GAME_MANIFEST_FILE, os.path.getmtime(self.mapper_file) + 100)
+        
+        self.assertFalse(is_mapper_file_current(self.mapper_file, self.game_dir))
+    
+    def test_falls_back_to_shipping_executable(self):
+        """Test that the shipping executable is compared when there is no manifest file"""
+        self.create_game_file(SHIPPING_EXE_RELATIVE_PATH, os.path.getmtime(self.mapper_file) + 100)
+        
+        self.assertFalse(is_mapper_file_current(self.mapper_file, self.game_dir))
+    
+    def test_unknown_game_install_is_not_current(self):
+        """Test that a mapper is not trusted when the game's install time can't be determined"""
+        self.assertFalse(is_mapper_file_current(self.mapper_file, self.game_dir))
+    
+    def test_missing_mapper_file_is_not_current(self):
+        """Test that a missing mapper file is not current"""
+        self.create_game_file(GAME_MANIFEST_FILE, 0)
+        
+        self.assertFalse(is_mapper_file_current(os.path.join(self.test_dir, "missing.usmap"), self.game_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
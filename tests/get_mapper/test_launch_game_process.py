@@ -0,0 +1,47 @@
+import unittest
+import os
+import subprocess
+from unittest.mock import patch, MagicMock
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+# Import from the src directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src')))
+from mapper.get_mapper import launch_game_process, GAME_STARTUP_CHECK_TIME
+
+
+@patch('mapper.get_mapper.subprocess.Popen')
+class TestLaunchGameProcess(unittest.TestCase):
+    """Test cases for launch_game_process function"""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.game_process = MagicMock()
+        self.game_process.pid = 1234
+    
+    def test_launch_game_process_still_running(self, mock_popen):
+        """Test that a game still running after the startup check is returned"""
+        self.game_process.wait.side_effect = subprocess.TimeoutExpired("Game.exe", GAME_STARTUP_CHECK_TIME)
+        mock_popen.return_value = self.game_process
+        
+        result = launch_game_process("Game.exe")
+        
+        self.assertIs(result, self.game_process)
+        mock_popen.assert_called_once_with(["Game.exe"])
+        self.game_process.wait.assert_called_once_with(timeout=2)
+    
+    def test_launch_game_process_exits_during_startup_check(self, mock_popen):
+        """Test that a game exiting during the startup check raises with its exit code"""
+        self.game_process.wait.return_value = 3
+        self.game_process.returncode = 3
+        mock_popen.return_value = self.game_process
+        
+        with self.assertRaises(Exception) as context:
+            launch_game_process("Game.exe")
+        
+        self.assertIn("Game process failed to start", str(context.exception))
+        self.assertIn("exit code: 3", str(context.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import os
+import tempfile
+import shutil
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+# Import from the src directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src')))
+from mapper.get_mapper import list_mapper_files
+
+
+class TestListMapperFiles(unittest.TestCase):
+    """Test cases for list_mapper_files function"""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.test_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """Clean up after each test method."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def test_list_mapper_files_found(self):
+        """Test list_mapper_files returns mapper files inside an SDK Mappings directory"""
+        mappings_dir = os.path.join(self.test_dir, "TestSDK", "Mappings")
+        os.makedirs(os.path.join(mappings_dir, "subdir"))
+        mapper_file = os.path.join(mappings_dir, "test_mapper.usmap")
+        with open(mapper_file, 'w') as f:
+            f.write("test mapper content")
+        
+        result = list_mapper_files(self.test_dir)
+        
+        self.assertEqual(result, [mapper_file])
+    
+    def test_list_mapper_files_empty_output(self):
+        """Test list_mapper_files returns an empty list for an empty output directory"""
+        self.assertEqual(list_mapper_files(self.test_dir), [])
+    
+    def test_list_mapper_files_missing_output(self):
+        """Test list_mapper_files returns an empty list when the output directory does not exist"""
+        missing_dir = os.path.join(self.test_dir, "does_not_exist")
+        
+        self.assertEqual(list_mapper_files(missing_dir), [])
+    
+    def test_list_mapper_files_special_characters_in_path(self):
+        """Test list_mapper_files treats glob characters in the output path literally"""
+        output_dir = os.path.join(self.test_dir, "output [1]")
+        mappings_dir = os.path.join(output_dir, "TestSDK", "Mappings")
+        os.makedirs(mappings_dir)
+        mapper_file = os.path.join(mappings_dir, "test_mapper.usmap")
+        with open(mapper_file, 'w') as f:
+            f.write("test mapper content")
+        
+        self.assertEqual(list_mapper_files(output_dir), [mapper_file])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import os
+import tempfile
+import shutil
+from types import SimpleNamespace
+from unittest.mock import patch
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+# Import from the src directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src')))
+from mapper.get_mapper import main, GAME_MANIFEST_FILE
+
+
+class TestMain(unittest.TestCase):
+    """Test cases for the mapper main function's reuse of existing Dumper-7 output"""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.test_dir = tempfile.mkdtemp()
+        self.game_dir = os.path.join(self.test_dir, "game")
+        self.dumper7_output_dir = os.path.join(self.test_dir, "dumper7")
+        os.makedirs(self.game_dir)
+        self.options = SimpleNamespace(
+            force_get_mapper=False,
+            output_mapper_file=os.path.join(self.test_dir, "output", "mapper.usmap"),
+            dumper7_output_dir=self.dumper7_output_dir,
+            steam_game_download_dir=self.game_dir,
+        )
+        
+        mappings_dir = os.path.join(self.dumper7_output_dir, "TestSDK", "Mappings")
+        os.makedirs(mappings_dir)
+        self.dumped_mapper_file = os.path.join(mappings_dir, "dumped.usmap")
+        with open(self.dumped_mapper_file, 'w') as f:
+            f.write("dumped mapper content")
+    
+    def tearDown(self):
+        """Clean up after each test method."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def write_game_manifest(self, mtime_offset):
+        """Helper method to write the game manifest file relative to the dumped mapper's modification time"""
+        manifest_path = os.path.join(self.game_dir, GAME_MANIFEST_FILE)
+        with open(manifest_path, 'w') as f:
+            f.write("1234567890")
+        mtime = os.path.getmtime(self.dumped_mapper_file) + mtime_offset
+        os.utime(manifest_path, (mtime, mtime))
+    
+    @patch('mapper.get_mapper.launch_game_process')
+    def test_main_reuses_current_dumper7_output(self, mock_launch):
+        """Test that a mapper dumped from the installed game build is copied instead of re-created"""
+        self.write_game_manifest(-100)
+        
+        result = main(self.options)
+        
+        self.assertEqual(result, self.options.output_mapper_file)
+        with open(self.options.output_mapper_file, 'r') as f:
+            self.assertEqual(f.read(), "dumped mapper content")
+        mock_launch.assert_not_called()
+    
+    @patch('mapper.get_mapper.launch_game_process')
+    def test_main_does_not_reuse_stale_dumper7_output(self, mock_launch):
+        """Test that a mapper dumped before a game update is not copied to the new output file"""
+        self.write_game_manifest(100)
+        
+        # Without a shipping executable the regeneration path stops at its first check
+        with self.assertRaises(ValueError) as context:
+            main(self.options)
+        
+        self.assertIn("Shipping executable not found", str(context.exception))
+        self.assertFalse(os.path.exists(self.options.output_mapper_file))
+        mock_launch.assert_not_called()
+    
+    @patch('mapper.get_mapper.launch_game_process')
+    def test_main_force_skips_reuse(self, mock_launch):
+        """Test that FORCE_GET_MAPPER ignores existing Dumper-7 output"""
+        self.write_game_manifest(-100)
+        self.options.force_get_mapper = True
+        
+        with self.assertRaises(ValueError):
+            main(self.options)
+        
+        self.assertFalse(os.path.exists(self.options.output_mapper_file))
+    
+    def test_main_requires_options(self):
+        """Test that main raises when no options are given"""
+        with self.assertRaises(ValueError):
+            main(None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import os
+from unittest.mock import patch, MagicMock
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+# Import from the src directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src')))
+from mapper.get_mapper import perform_dll_injection, ENGINE_SETTLE_TIME
+
+
+@patch('mapper.get_mapper.inject_dll_into_process')
+@patch('mapper.get_mapper.wait_for_process_ready_for_injection')
+@patch('mapper.get_mapper.wait_for_process_input_idle')
+class TestPerformDllInjection(unittest.TestCase):
+    """Test cases for perform_dll_injection function"""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.game_process = MagicMock()
+        self.game_process.pid = 1234
+    
+    def test_input_idle_keeps_engine_settle_time(self, mock_input_idle, mock_ready, mock_inject):
+        """Test that the engine still gets time to settle after the game reports input idle"""
+        mock_input_idle.return_value = True
+        mock_inject.return_value = True
+        
+        result = perform_dll_injection("Game.exe", "Dumper-7.dll", self.game_process)
+        
+        self.assertTrue(result)
+        mock_input_idle.assert_called_once_with(1234, timeout=10)
+        mock_ready.assert_called_once_with("Game.exe", initialization_time=ENGINE_SETTLE_TIME)
+        self.assertGreater(ENGINE_SETTLE_TIME, 0)
+        mock_inject.assert_called_once_with("Game.exe", "Dumper-7.dll")
+    
+    def test_input_idle_unavailable_waits_remaining_time(self, mock_input_idle, mock_ready, mock_inject):
+        """Test that the remaining initialization time is waited when input idle isn't reported"""
+        mock_input_idle.return_value = False
+        mock_inject.return_value = True
+        
+        perform_dll_injection("Game.exe", "Dumper-7.dll", self.game_process)
+        
+        initialization_time = mock_ready.call_args[1]['initialization_time']
+        self.assertLessEqual(initialization_time, 10)
+        self.assertGreaterEqual(initialization_time, 9)
+    
+    def test_without_game_process_waits_full_time(self, mock_input_idle, mock_ready, mock_inject):
+        """Test that the full initialization time is waited when no process object is given"""
+        mock_inject.return_value = True
+        
+        perform_dll_injection("Game.exe", "Dumper-7.dll")
+        
+        mock_input_idle.assert_not_called()
+        mock_ready.assert_called_once_with("Game.exe", initialization_time=10)
+    
+    def test_injection_failure_returns_false(self, mock_input_idle, mock_ready, mock_inject):
+        """Test that a failed injection is reported"""
+        mock_input_idle.return_value = True
+        mock_inject.return_value = False
+        
+        result = perform_dll_injection("Game.exe", "Dumper-7.dll", self.game_process)
+        
+        self.assertFalse(result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import os
+import tempfile
+import shutil
+from unittest.mock import patch, MagicMock
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+# Import from the src directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src')))
+from mapper.get_mapper import terminate_game_process
+
+
+class TestTerminateGameProcess(unittest.TestCase):
+    """Test cases for terminate_game_process function"""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.test_dir = tempfile.mkdtemp()
+        self.game_process = MagicMock()
+    
+    def tearDown(self):
+        """Clean up after each test method."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    @patch('mapper.get_mapper.terminate_process_by_name')
+    @patch('mapper.get_mapper.terminate_process_object')
+    @patch('mapper.get_mapper.time.sleep')
+    def test_terminate_game_process_stops_waiting_when_game_crashed(self, mock_sleep, mock_terminate_object, mock_terminate_by_name):
+        """Test that a crashed game doesn't hold up termination for the full mapper wait"""
+        self.game_process.poll.return_value = 3221225477
+        self.game_process.returncode = 3221225477
+        mock_terminate_object.return_value = True
+        
+        terminate_game_process(self.game_process, "Game.exe", self.test_dir)
+        
+        mock_sleep.assert_not_called()
+        mock_terminate_object.assert_called_once_with(self.game_process, 'launch-game')
+        mock_terminate_by_name.assert_not_called()
+    
+    @patch('mapper.get_mapper.terminate_process_by_name')
+    @patch('mapper.get_mapper.terminate_process_object')
+    @patch('mapper.get_mapper.wait_for_mapper_file')
+    def test_terminate_game_process_falls_back_to_name(self, mock_wait, mock_terminate_object, mock_terminate_by_name):
+        """Test that the game is terminated by name if the process object can't be terminated"""
+        mock_wait.return_value = True
+        mock_terminate_object.return_value = False
+        
+        terminate_game_process(self.game_process, "Game.exe", self.test_dir)
+        
+        mock_wait.assert_called_once_with(self.test_dir, timeout=10, game_process=self.game_process)
+        mock_terminate_by_name.assert_called_once_with("Game.exe")
+
+
+if __name__ == '__main__':
+    unittest.main()
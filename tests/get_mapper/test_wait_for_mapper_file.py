@@ -0,0 +1,116 @@
+import unittest
+import os
+import tempfile
+import shutil
+from unittest.mock import patch, MagicMock
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+# Import from the src directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src')))
+from mapper.get_mapper import wait_for_mapper_file
+
+
+class TestWaitForMapperFile(unittest.TestCase):
+    """Test cases for wait_for_mapper_file function"""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.test_dir = tempfile.mkdtemp()
+        self.mappings_dir = os.path.join(self.test_dir, "TestSDK", "Mappings")
+    
+    def tearDown(self):
+        """Clean up after each test method."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def create_mapper_file(self, content="test mapper content"):
+        """Helper method to write a mapper file into the SDK Mappings directory"""
+        os.makedirs(self.mappings_dir, exist_ok=True)
+        mapper_file = os.path.join(self.mappings_dir, "test_mapper.usmap")
+        with open(mapper_file, 'w') as f:
+            f.write(content)
+        return mapper_file
+    
+    def test_wait_for_mapper_file_already_written(self):
+        """Test wait_for_mapper_file returns True once an existing mapper file is stable"""
+        self.create_mapper_file()
+        
+        result = wait_for_mapper_file(self.test_dir, timeout=2, poll_interval=0.01)
+        
+        self.assertTrue(result)
+    
+    def test_wait_for_mapper_file_times_out(self):
+        """Test wait_for_mapper_file returns False when no mapper file appears"""
+        os.makedirs(self.mappings_dir)
+        
+        result = wait_for_mapper_file(self.test_dir, timeout=0.05, poll_interval=0.01)
+        
+        self.assertFalse(result)
+    
+    def test_wait_for_mapper_file_ignores_empty_file(self):
+        """Test wait_for_mapper_file keeps waiting while the mapper file is empty"""
+        self.create_mapper_file(content="")
+        
+        result = wait_for_mapper_file(self.test_dir, timeout=0.05, poll_interval=0.01)
+        
+        self.assertFalse(result)
+    
+    def test_wait_for_mapper_file_waits_for_size_to_settle(self):
+        """Test wait_for_mapper_file does not return while the mapper file is still growing"""
+        mapper_file = self.create_mapper_file(content="a")
+        
+        sizes = iter([1, 2, 3, 3])
+        with patch('os.path.getsize', side_effect=lambda path: next(sizes)) as mock_getsize:
+            result = wait_for_mapper_file(self.test_dir, timeout=2, poll_interval=0.01)
+        
+        self.assertTrue(result)
+        self.assertEqual(mock_getsize.call_count, 4)
+        mock_getsize.assert_called_with(mapper_file)
+    
+    def test_wait_for_mapper_file_ignores_directories(self):
+        """Test wait_for_mapper_file ignores directories inside Mappings"""
+        os.makedirs(os.path.join(self.mappings_dir, "subdir"))
+        
+        result = wait_for_mapper_file(self.test_dir, timeout=0.05, poll_interval=0.01)
+        
+        self.assertFalse(result)
+    
+    def test_wait_for_mapper_file_stops_when_game_exits(self):
+        """Test wait_for_mapper_file stops waiting as soon as the game process has exited"""
+        os.makedirs(self.mappings_dir)
+        game_process = MagicMock()
+        game_process.poll.return_value = 1
+        game_process.returncode = 1
+        
+        with patch('mapper.get_mapper.time.sleep') as mock_sleep:
+            result = wait_for_mapper_file(self.test_dir, timeout=60, poll_interval=0.01, game_process=game_process)
+        
+        self.assertFalse(result)
+        game_process.poll.assert_called_once()
+        mock_sleep.assert_not_called()
+    
+    def test_wait_for_mapper_file_accepts_mapper_written_before_exit(self):
+        """Test wait_for_mapper_file returns True when the game exits after writing the mapper file"""
+        self.create_mapper_file()
+        game_process = MagicMock()
+        game_process.poll.return_value = 0
+        game_process.returncode = 0
+        
+        result = wait_for_mapper_file(self.test_dir, timeout=60, poll_interval=0.01, game_process=game_process)
+        
+        self.assertTrue(result)
+    
+    def test_wait_for_mapper_file_keeps_waiting_while_game_runs(self):
+        """Test wait_for_mapper_file keeps polling while the game process is still running"""
+        self.create_mapper_file()
+        game_process = MagicMock()
+        game_process.poll.return_value = None
+        
+        result = wait_for_mapper_file(self.test_dir, timeout=2, poll_interval=0.01, game_process=game_process)
+        
+        self.assertTrue(result)
+        self.assertEqual(game_process.poll.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import os
+import io
+import zipfile
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add the src directory to the Python path to import dependency_manager
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+sys.path.insert(0, src_path)
+
+# Import directly from the src.dependency_manager module to avoid conflicts
+import importlib.util
+spec = importlib.util.spec_from_file_location("src_dependency_manager", os.path.join(src_path, "dependency_manager.py"))
+src_dependency_manager = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(src_dependency_manager)
+
+DependencyManager = src_dependency_manager.DependencyManager
+
+
+class TestDownloadAndExtract(unittest.TestCase):
+    """Test cases for download_and_extract function"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.dm = DependencyManager()
+        self.test_dir = tempfile.mkdtemp()
+        self.test_path = Path(self.test_dir)
+        self.dm.download_cache_dir = self.test_path / "downloads"
+        self.output_path = self.test_path / "output"
+        self.url = "https://example.com/tool.zip"
+
+        logger_patcher = patch.object(src_dependency_manager, 'logger')
+        logger_patcher.start()
+        self.addCleanup(logger_patcher.stop)
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _zip_bytes(self, payload_size):
+        """Helper method to build an uncompressed ZIP holding tool.exe of payload_size bytes."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zf:
+            zf.writestr("tool.exe", b"x" * payload_size)
+        return buffer.getvalue()
+
+    def _download_bytes(self, data):
+        """Helper method returning a _download_file stand-in that writes data."""
+        def download(url, output_path):
+            output_path.write_bytes(data)
+        return download
+
+    def test_rejects_tiny_download(self):
+        """Test a download under 1000 bytes is rejected and removed from the cache."""
+        data = b"<html>rate limited</html>"
+
+        with patch.object(self.dm, '_download_file', side_effect=self._download_bytes(data)):
+            with self.assertRaises(Exception) as context:
+                self.dm.download_and_extract(self.url, self.output_path, "tool.exe")
+
+        self.assertIn("too small", str(context.exception))
+        self.assertFalse(self.dm._get_download_cache_path(self.url).exists())
+        self.assertFalse((self.output_path / "tool.exe").exists())
+
+    def test_rejects_small_valid_zip(self):
+        """Test the size guard applies even to a well formed archive under 1000 bytes."""
+        data = self._zip_bytes(10)
+        self.assertLess(len(data), 1000)
+
+        with patch.object(self.dm, '_download_file', side_effect=self._download_bytes(data)):
+            with self.assertRaises(Exception) as context:
+                self.dm.download_and_extract(self.url, self.output_path, "tool.exe")
+
+        self.assertIn("too small", str(context.exception))
+
+    def test_accepts_download_of_at_least_1000_bytes(self):
+        """Test an archive of 1000 bytes or more is extracted and kept in the cache."""
+        data = self._zip_bytes(2000)
+
+        with patch.object(self.dm, '_download_file', side_effect=self._download_bytes(data)):
+            result = self.dm.download_and_extract(self.url, self.output_path, "tool.exe", version="v1.0.0")
+
+        self.assertTrue(result)
+        self.assertEqual((self.output_path / "tool.exe").stat().st_size, 2000)
+        self.assertEqual((self.output_path / "version.txt").read_text(), "v1.0.0")
+        self.assertTrue(self.dm._get_download_cache_path(self.url).exists())
+
+    def test_large_invalid_archive_reports_bad_zip(self):
+        """Test a large enough download that isn't a ZIP fails in extraction."""
+        with patch.object(self.dm, '_download_file', side_effect=self._download_bytes(b"x" * 2000)):
+            with self.assertRaises(Exception) as context:
+                self.dm.download_and_extract(self.url, self.output_path, "tool.exe")
+
+        self.assertIn("not a valid ZIP archive", str(context.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+import os
+import io
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+from urllib.error import HTTPError, URLError
+import sys
+
+# Add the src directory to the Python path to import dependency_manager
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+sys.path.insert(0, src_path)
+
+# Import directly from the src.dependency_manager module to avoid conflicts
+import importlib.util
+spec = importlib.util.spec_from_file_location("src_dependency_manager", os.path.join(src_path, "dependency_manager.py"))
+src_dependency_manager = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(src_dependency_manager)
+
+DependencyManager = src_dependency_manager.DependencyManager
+
+
+class TestDownloadFile(unittest.TestCase):
+    """Test cases for _download_file function"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.dm = DependencyManager()
+        self.test_dir = tempfile.mkdtemp()
+        self.test_path = Path(self.test_dir)
+        self.output_path = self.test_path / "abc_tool.zip"
+        self.etag_path = self.test_path / "abc_tool.zip.etag"
+        self.url = "https://example.com/tool.zip"
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        if self.test_path.exists():
+            shutil.rmtree(self.test_path)
+
+    def _mock_response(self, body, etag=None):
+        """Helper method to create a mock urlopen response."""
+        response = MagicMock()
+        stream = io.BytesIO(body)
+        response.read.side_effect = stream.read
+        response.headers = {'Content-Length': str(len(body))}
+        if etag:
+            response.headers['ETag'] = etag
+        response.__enter__.return_value = response
+        return response
+
+    def test_download_file_writes_file_and_etag(self):
+        """Test _download_file writes the body and stores the response ETag."""
+        with patch.object(src_dependency_manager, 'urlopen', return_value=self._mock_response(b"zip data", '"v1"')) as mock_urlopen:
+            with patch.object(src_dependency_manager, 'logger'):
+                self.dm._download_file(self.url, self.output_path)
+
+        self.assertEqual(self.output_path.read_bytes(), b"zip data")
+        self.assertEqual(self.etag_path.read_text(), '"v1"')
+        request = mock_urlopen.call_args[0][0]
+        self.assertIsNone(request.get_header('If-none-match'))
+
+    def test_download_file_sends_stored_etag(self):
+        """Test _download_file makes the request conditional when an earlier download exists."""
+        self.output_path.write_bytes(b"old zip data")
+        self.etag_path.write_text('"v1"')
+
+        with patch.object(src_dependency_manager, 'urlopen', return_value=self._mock_response(b"new zip data", '"v2"')) as mock_urlopen:
+            with patch.object(src_dependency_manager, 'logger'):
+                self.dm._download_file(self.url, self.output_path)
+
+        request = mock_urlopen.call_args[0][0]
+        self.assertEqual(request.get_header('If-none-match'), '"v1"')
+        self.assertEqual(self.output_path.read_bytes(), b"new zip data")
+        self.assertEqual(self.etag_path.read_text(), '"v2"')
+
+    def test_download_file_not_modified_keeps_existing_file(self):
+        """Test _download_file keeps the cached file when the server replies 304."""
+        self.output_path.write_bytes(b"old zip data")
+        self.etag_path.write_text('"v1"')
+        not_modified = HTTPError(self.url, 304, "Not Modified", {}, None)
+
+        with patch.object(src_dependency_manager, 'urlopen', side_effect=not_modified):
+            with patch.object(src_dependency_manager, 'logger'):
+                self.dm._download_file(self.url, self.output_path)
+
+        self.assertEqual(self.output_path.read_bytes(), b"old zip data")
+        self.assertEqual(self.etag_path.read_text(), '"v1"')
+
+    def test_download_file_ignores_etag_without_file(self):
+        """Test _download_file does not send a stored ETag when the cached file is missing."""
+        self.etag_path.write_text('"v1"')
+
+        with patch.object(src_dependency_manager, 'urlopen', return_value=self._mock_response(b"zip data")) as mock_urlopen:
+            with patch.object(src_dependency_manager, 'logger'):
+                self.dm._download_file(self.url, self.output_path)
+
+        request = mock_urlopen.call_args[0][0]
+        self.assertIsNone(request.get_header('If-none-match'))
+        self.assertFalse(self.etag_path.exists())
+
+    def test_download_file_http_error(self):
+        """Test _download_file raises on HTTP errors other than 304."""
+        not_found = HTTPError(self.url, 404, "Not Found", {}, None)
+
+        with patch.object(src_dependency_manager, 'urlopen', side_effect=not_found):
+            with self.assertRaises(Exception) as context:
+                self.dm._download_file(self.url, self.output_path)
+
+        self.assertIn("Failed to download file", str(context.exception))
+
+    def test_download_file_url_error(self):
+        """Test _download_file raises on connection errors."""
+        with patch.object(src_dependency_manager, 'urlopen', side_effect=URLError("Connection refused")):
+            with self.assertRaises(Exception) as context:
+                self.dm._download_file(self.url, self.output_path)
+
+        self.assertIn("Failed to download file", str(context.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import os
+import tempfile
+import shutil
+import threading
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add the src directory to the Python path to import dependency_manager
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+sys.path.insert(0, src_path)
+
+# Import directly from the src.dependency_manager module to avoid conflicts
+import importlib.util
+spec = importlib.util.spec_from_file_location("src_dependency_manager", os.path.join(src_path, "dependency_manager.py"))
+src_dependency_manager = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(src_dependency_manager)
+
+DependencyManager = src_dependency_manager.DependencyManager
+
+
+class TestDownloadGithubReleaseLatest(unittest.TestCase):
+    """Test cases for download_github_release_latest function"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.dm = DependencyManager()
+        self.test_dir = tempfile.mkdtemp()
+        self.dm.temp_dir = Path(self.test_dir) / "temp"
+        self.output_path = Path(self.test_dir) / "output"
+        self.release_info = {
+            'tag_name': 'v2.0.0',
+            'assets': [
+                {'name': 'Tool-windows-x64.zip', 'browser_download_url': 'https://example.com/Tool-windows-x64.zip'},
+                {'name': 'README.md', 'browser_download_url': 'https://example.com/README.md'},
+            ],
+        }
+        self.patterns = ["Tool-windows-x64.zip", "README.md"]
+
+        patcher = patch.object(self.dm, '_get_json_from_url_cached', return_value=self.release_info)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        logger_patcher = patch.object(src_dependency_manager, 'logger')
+        self.mock_logger = logger_patcher.start()
+        self.addCleanup(logger_patcher.stop)
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _download_readme(self, url, output_path):
+        """Helper method standing in for _download_single_file."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text("readme")
+
+    def test_assets_processed_in_parallel(self):
+        """Test the archive and single file downloads run at the same time."""
+        # Each download waits for the other, so running them one after another breaks the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def extract(*args, **kwargs):
+            barrier.wait()
+            return True
+
+        def download(url, output_path):
+            barrier.wait()
+            self._download_readme(url, output_path)
+
+        with patch.object(self.dm, 'download_and_extract', side_effect=extract):
+            with patch.object(self.dm, '_download_single_file', side_effect=download):
+                result = self.dm.download_github_release_latest("owner", "repo", self.patterns, self.output_path)
+
+        self.assertTrue(result)
+        self.assertEqual((self.output_path / "README.md").read_text(), "readme")
+
+    def test_failed_archive_keeps_readme_out_of_install(self):
+        """Test the README isn't installed when the archive from the same release failed."""
+        with patch.object(self.dm, 'download_and_extract', side_effect=Exception("extraction failed")):
+            with patch.object(self.dm, '_download_single_file', side_effect=self._download_readme):
+                result = self.dm.download_github_release_latest("owner", "repo", self.patterns, self.output_path)
+
+        self.assertFalse(result)
+        self.assertFalse((self.output_path / "README.md").exists())
+
+    def test_failures_are_aggregated(self):
+        """Test every failed asset is reported and the release is reported as failed."""
+        with patch.object(self.dm, 'download_and_extract', side_effect=Exception("extraction failed")):
+            with patch.object(self.dm, '_download_single_file', side_effect=Exception("download failed")):
+                result = self.dm.download_github_release_latest("owner", "repo", self.patterns, self.output_path)
+
+        self.assertFalse(result)
+        error_messages = [call[0][0] for call in self.mock_logger.error.call_args_list]
+        self.assertTrue(any("Tool-windows-x64.zip" in msg for msg in error_messages))
+        self.assertTrue(any("README.md" in msg for msg in error_messages))
+
+    def test_extraction_reporting_failure_counts_as_failed(self):
+        """Test an archive install returning False fails the release."""
+        with patch.object(self.dm, 'download_and_extract', return_value=False):
+            with patch.object(self.dm, '_download_single_file', side_effect=self._download_readme):
+                result = self.dm.download_github_release_latest("owner", "repo", self.patterns, self.output_path)
+
+        self.assertFalse(result)
+        self.assertFalse((self.output_path / "README.md").exists())
+
+    def test_installed_version_skips_download(self):
+        """Test nothing is downloaded when the latest version is already installed."""
+        with patch.object(self.dm, '_get_installed_version', return_value='v2.0.0'):
+            with patch.object(self.dm, '_process_asset') as mock_process_asset:
+                result = self.dm.download_github_release_latest("owner", "repo", self.patterns, self.output_path)
+
+        self.assertTrue(result)
+        mock_process_asset.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -106,6 +106,40 @@ class TestExtractZip(unittest.TestCase):
             
             # Should have been flattened - main subdir should be removed
 
+    def test_extract_zip_strips_single_subdirectory_into_populated_output(self):
+        """Test that a single top-level directory is stripped even if the output directory already has files."""
+        (self.output_path / 'README.md').write_text('Existing readme')
+        (self.output_path / 'version.txt').write_text('v1')
+        files = {'file1.txt': 'Content 1', 'nested/file2.txt': 'Content 2'}
+        self._create_test_zip(self.zip_path, files, use_subdirectory=True)
+
+        with patch.object(src_dependency_manager, 'logger'):
+            self.dm._extract_zip(self.zip_path, self.output_path)
+
+        self.assertEqual((self.output_path / 'file1.txt').read_text(), 'Content 1')
+        self.assertEqual((self.output_path / 'nested' / 'file2.txt').read_text(), 'Content 2')
+        self.assertTrue((self.output_path / 'README.md').exists())
+        self.assertFalse((self.output_path / 'subdir').exists())
+
+    def test_extract_zip_skips_macos_metadata(self):
+        """Test that __MACOSX and .DS_Store entries are not extracted."""
+        files = {
+            'readme.txt': 'Hello World',
+            '.DS_Store': 'junk',
+            'docs/.DS_Store': 'junk',
+            '__MACOSX/._readme.txt': 'junk'
+        }
+        self._create_test_zip(self.zip_path, files)
+
+        with patch.object(src_dependency_manager, 'logger') as mock_logger:
+            self.dm._extract_zip(self.zip_path, self.output_path)
+
+            self.assertTrue((self.output_path / 'readme.txt').exists())
+            self.assertFalse((self.output_path / '.DS_Store').exists())
+            self.assertFalse((self.output_path / 'docs' / '.DS_Store').exists())
+            self.assertFalse((self.output_path / '__MACOSX').exists())
+            mock_logger.info.assert_called_with(f"Extracted 1 files to {self.output_path}")
+
     def test_extract_zip_logs_archive_contents(self):
         """Test that _extract_zip logs the archive contents."""
         files = {f'file_{i}.txt': f'Content {i}' for i in range(5)}
@@ -157,6 +191,7 @@ class TestExtractZip(unittest.TestCase):
             self.dm._extract_zip(self.zip_path, self.output_path)
         
         self.assertIn("Failed to extract ZIP file", str(context.exception))
+        self.assertIn("not a valid ZIP archive", str(context.exception))
 
     @patch('zipfile.ZipFile')
     def test_extract_zip_handles_extraction_error(self, mock_zipfile_class):
@@ -174,16 +209,20 @@ class TestExtractZip(unittest.TestCase):
         
         self.assertIn("Failed to extract ZIP file: Access denied", str(context.exception))
 
-    def test_extract_zip_calls_flatten_extraction(self):
-        """Test that _extract_zip calls _flatten_extraction."""
-        files = {'test.txt': 'content'}
+    def test_extract_zip_leaves_existing_install_structure(self):
+        """Test that an archive with nothing but macOS metadata doesn't restructure the output directory."""
+        files = {'__MACOSX/._a': 'metadata', '.DS_Store': 'metadata'}
         self._create_test_zip(self.zip_path, files)
+        plugin_file = self.output_path / "Plugins" / "p" / "f"
+        plugin_file.parent.mkdir(parents=True)
+        plugin_file.write_text("plugin")
+        
+        with patch.object(src_dependency_manager, 'logger'):
+            extracted_files = self.dm._extract_zip(self.zip_path, self.output_path)
         
-        with patch.object(self.dm, '_flatten_extraction') as mock_flatten:
-            with patch.object(src_dependency_manager, 'logger'):
-                self.dm._extract_zip(self.zip_path, self.output_path)
-                
-                mock_flatten.assert_called_once_with(self.output_path)
+        self.assertEqual(extracted_files, {})
+        self.assertEqual(plugin_file.read_text(), "plugin")
+        self.assertFalse((self.output_path / "p").exists())
 
     def test_extract_zip_large_file_count_logging(self):
         """Test logging behavior with exactly 10 files (boundary condition)."""
@@ -0,0 +1,125 @@
+import unittest
+import os
+import io
+import gzip
+import json
+from unittest.mock import patch, MagicMock
+from urllib.error import HTTPError
+import sys
+
+# Add the src directory to the Python path to import dependency_manager
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+sys.path.insert(0, src_path)
+
+# Import directly from the src.dependency_manager module to avoid conflicts
+import importlib.util
+spec = importlib.util.spec_from_file_location("src_dependency_manager", os.path.join(src_path, "dependency_manager.py"))
+src_dependency_manager = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(src_dependency_manager)
+
+DependencyManager = src_dependency_manager.DependencyManager
+
+
+class TestGetJsonFromUrl(unittest.TestCase):
+    """Test cases for _get_json_from_url function"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.dm = DependencyManager()
+        self.url = "https://api.github.com/repos/owner/repo/releases/latest"
+        self.data = {'tag_name': 'v1.0.0'}
+
+    def _mock_response(self, body, headers=None):
+        """Helper method to create a mock urlopen response."""
+        response = MagicMock()
+        response.read.side_effect = io.BytesIO(body).read
+        response.headers = headers or {}
+        response.__enter__.return_value = response
+        return response
+
+    def _get_json(self, response, env=None, etag=None):
+        """Helper method to call _get_json_from_url with a mocked response and environment."""
+        with patch.dict(os.environ, env or {}, clear=False):
+            if not env:
+                os.environ.pop('GITHUB_TOKEN', None)
+            with patch.object(src_dependency_manager, 'urlopen', return_value=response) as mock_urlopen:
+                with patch.object(src_dependency_manager, 'logger') as mock_logger:
+                    result = self.dm._get_json_from_url(self.url, etag=etag)
+        return result, mock_urlopen.call_args[0][0], mock_logger
+
+    def test_plain_response(self):
+        """Test an uncompressed body is parsed and its ETag returned."""
+        body = json.dumps(self.data).encode()
+
+        (data, etag), request, _ = self._get_json(self._mock_response(body, {'ETag': '"v1"'}))
+
+        self.assertEqual(data, self.data)
+        self.assertEqual(etag, '"v1"')
+        self.assertEqual(request.get_header('Accept-encoding'), 'gzip')
+        self.assertEqual(request.get_header('Accept'), 'application/vnd.github+json')
+        self.assertEqual(request.get_header('X-github-api-version'), '2022-11-28')
+
+    def test_gzip_response(self):
+        """Test a gzip encoded body is decompressed before parsing."""
+        body = gzip.compress(json.dumps(self.data).encode())
+
+        (data, _), _, _ = self._get_json(self._mock_response(body, {'Content-Encoding': 'gzip'}))
+
+        self.assertEqual(data, self.data)
+
+    def test_authorization_sent_with_token(self):
+        """Test the Authorization header is sent when GITHUB_TOKEN is set."""
+        body = json.dumps(self.data).encode()
+
+        _, request, _ = self._get_json(self._mock_response(body), env={'GITHUB_TOKEN': 'abc123'})
+
+        self.assertEqual(request.get_header('Authorization'), 'Bearer abc123')
+
+    def test_authorization_not_sent_without_token(self):
+        """Test no Authorization header is sent when GITHUB_TOKEN is not set."""
+        body = json.dumps(self.data).encode()
+
+        _, request, _ = self._get_json(self._mock_response(body))
+
+        self.assertIsNone(request.get_header('Authorization'))
+
+    def test_rate_limit_warning_below_threshold(self):
+        """Test a warning is logged when fewer than 10 API requests remain."""
+        body = json.dumps(self.data).encode()
+
+        _, _, mock_logger = self._get_json(self._mock_response(body, {'X-RateLimit-Remaining': '9'}))
+
+        mock_logger.warning.assert_called_once()
+        self.assertIn("rate limit", mock_logger.warning.call_args[0][0])
+
+    def test_no_rate_limit_warning_at_threshold(self):
+        """Test no warning is logged when 10 or more API requests remain."""
+        body = json.dumps(self.data).encode()
+
+        _, _, mock_logger = self._get_json(self._mock_response(body, {'X-RateLimit-Remaining': '10'}))
+
+        mock_logger.warning.assert_not_called()
+
+    def test_not_modified_returns_none(self):
+        """Test a 304 reply to a conditional request returns no data and the sent ETag."""
+        not_modified = HTTPError(self.url, 304, "Not Modified", {}, None)
+
+        with patch.object(src_dependency_manager, 'urlopen', side_effect=not_modified) as mock_urlopen:
+            result = self.dm._get_json_from_url(self.url, etag='"v1"')
+
+        self.assertEqual(result, (None, '"v1"'))
+        self.assertEqual(mock_urlopen.call_args[0][0].get_header('If-none-match'), '"v1"')
+
+    def test_invalid_gzip_raises(self):
+        """Test a body that claims gzip but isn't raises a fetch error."""
+        response = self._mock_response(b"not gzip", {'Content-Encoding': 'gzip'})
+
+        with patch.object(src_dependency_manager, 'urlopen', return_value=response):
+            with self.assertRaises(Exception) as context:
+                self.dm._get_json_from_url(self.url)
+
+        self.assertIn("Failed to fetch JSON", str(context.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+import os
+import json
+import time
+import hashlib
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add the src directory to the Python path to import dependency_manager
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+sys.path.insert(0, src_path)
+
+# Import directly from the src.dependency_manager module to avoid conflicts
+import importlib.util
+spec = importlib.util.spec_from_file_location("src_dependency_manager", os.path.join(src_path, "dependency_manager.py"))
+src_dependency_manager = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(src_dependency_manager)
+
+DependencyManager = src_dependency_manager.DependencyManager
+
+
+class TestGetJsonFromUrlCached(unittest.TestCase):
+    """Test cases for _get_json_from_url_cached function"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.dm = DependencyManager()
+        self.test_dir = tempfile.mkdtemp()
+        self.dm.cache_dir = Path(self.test_dir)
+        self.url = "https://api.github.com/repos/owner/repo/releases/latest"
+        self.cache_file = self.dm.cache_dir / f"{hashlib.sha1(self.url.encode()).hexdigest()}.json"
+        self.etag_file = self.cache_file.with_suffix(".etag")
+        self.cached_data = {'tag_name': 'v1.0.0'}
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _write_cache(self, age, etag='"v1"'):
+        """Helper method to write a cached response that is age seconds old."""
+        self.cache_file.write_text(json.dumps(self.cached_data))
+        if etag:
+            self.etag_file.write_text(etag)
+        mtime = time.time() - age
+        os.utime(self.cache_file, (mtime, mtime))
+
+    def test_fresh_cache_hit_skips_network(self):
+        """Test a cached response younger than the TTL is returned without a request."""
+        self._write_cache(age=60)
+
+        with patch.object(self.dm, '_get_json_from_url') as mock_get_json:
+            result = self.dm._get_json_from_url_cached(self.url, ttl=3600)
+
+        self.assertEqual(result, self.cached_data)
+        mock_get_json.assert_not_called()
+
+    def test_not_modified_refreshes_timestamp(self):
+        """Test a stale cache is revalidated with its ETag and a 304 refreshes its timestamp."""
+        self._write_cache(age=7200)
+        old_mtime = self.cache_file.stat().st_mtime
+
+        with patch.object(self.dm, '_get_json_from_url', return_value=(None, '"v1"')) as mock_get_json:
+            result = self.dm._get_json_from_url_cached(self.url, ttl=3600)
+
+        self.assertEqual(result, self.cached_data)
+        mock_get_json.assert_called_once_with(self.url, etag='"v1"')
+        self.assertGreater(self.cache_file.stat().st_mtime, old_mtime + 3600)
+        self.assertEqual(json.loads(self.cache_file.read_text()), self.cached_data)
+
+    def test_modified_response_replaces_cache(self):
+        """Test a 200 response replaces the cached body and ETag."""
+        self._write_cache(age=7200)
+        new_data = {'tag_name': 'v2.0.0'}
+
+        with patch.object(self.dm, '_get_json_from_url', return_value=(new_data, '"v2"')):
+            result = self.dm._get_json_from_url_cached(self.url, ttl=3600)
+
+        self.assertEqual(result, new_data)
+        self.assertEqual(json.loads(self.cache_file.read_text()), new_data)
+        self.assertEqual(self.etag_file.read_text(), '"v2"')
+
+    def test_modified_response_without_etag_removes_stale_etag(self):
+        """Test an old ETag is dropped when the new response doesn't have one."""
+        self._write_cache(age=7200)
+
+        with patch.object(self.dm, '_get_json_from_url', return_value=({'tag_name': 'v2.0.0'}, None)):
+            self.dm._get_json_from_url_cached(self.url, ttl=3600)
+
+        self.assertFalse(self.etag_file.exists())
+
+    def test_ttl_zero_always_revalidates(self):
+        """Test a TTL of 0 revalidates even a brand new cache file."""
+        self._write_cache(age=0)
+
+        with patch.object(self.dm, '_get_json_from_url', return_value=(None, '"v1"')) as mock_get_json:
+            result = self.dm._get_json_from_url_cached(self.url, ttl=0)
+
+        self.assertEqual(result, self.cached_data)
+        mock_get_json.assert_called_once()
+
+    def test_corrupt_cache_falls_back_to_network(self):
+        """Test a cache file that isn't valid JSON is ignored and replaced from the network."""
+        self.cache_file.write_text("{not json")
+        self.etag_file.write_text('"v1"')
+        new_data = {'tag_name': 'v2.0.0'}
+
+        with patch.object(self.dm, '_get_json_from_url', return_value=(new_data, '"v2"')) as mock_get_json:
+            with patch.object(src_dependency_manager, 'logger'):
+                result = self.dm._get_json_from_url_cached(self.url, ttl=3600)
+
+        self.assertEqual(result, new_data)
+        # Without a usable body the ETag must not be sent, a 304 would leave nothing to return
+        mock_get_json.assert_called_once_with(self.url, etag=None)
+        self.assertEqual(json.loads(self.cache_file.read_text()), new_data)
+
+    def test_unreadable_cache_falls_back_to_network(self):
+        """Test a cache path that can't be read is ignored and the network response returned."""
+        self.cache_file.mkdir()
+        new_data = {'tag_name': 'v2.0.0'}
+
+        with patch.object(self.dm, '_get_json_from_url', return_value=(new_data, None)) as mock_get_json:
+            with patch.object(src_dependency_manager, 'logger'):
+                result = self.dm._get_json_from_url_cached(self.url, ttl=3600)
+
+        self.assertEqual(result, new_data)
+        mock_get_json.assert_called_once_with(self.url, etag=None)
+
+    def test_missing_cache_fetches_and_writes(self):
+        """Test the first request is fetched and written to the cache."""
+        new_data = {'tag_name': 'v1.0.0'}
+
+        with patch.object(self.dm, '_get_json_from_url', return_value=(new_data, '"v1"')):
+            result = self.dm._get_json_from_url_cached(self.url, ttl=3600)
+
+        self.assertEqual(result, new_data)
+        self.assertEqual(json.loads(self.cache_file.read_text()), new_data)
+        self.assertEqual(self.etag_file.read_text(), '"v1"')
+
+
+if __name__ == '__main__':
+    unittest.main()
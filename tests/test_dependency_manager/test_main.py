@@ -0,0 +1,68 @@
+import unittest
+import os
+from unittest.mock import patch
+import sys
+
+# Add the src directory to the Python path to import dependency_manager
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+sys.path.insert(0, src_path)
+
+# Import directly from the src.dependency_manager module to avoid conflicts
+import importlib.util
+spec = importlib.util.spec_from_file_location("src_dependency_manager", os.path.join(src_path, "dependency_manager.py"))
+src_dependency_manager = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(src_dependency_manager)
+
+
+@patch.object(src_dependency_manager, 'logger')
+@patch.object(src_dependency_manager, 'install_depot_downloader')
+@patch.object(src_dependency_manager, 'install_batch_export')
+class TestMain(unittest.TestCase):
+    """Test cases for the dependency manager main function"""
+
+    def test_all_installers_succeed(self, mock_batch_export, mock_depot_downloader, mock_logger):
+        """Test main reports success when every installer succeeds."""
+        mock_batch_export.return_value = True
+        mock_depot_downloader.return_value = True
+
+        self.assertTrue(src_dependency_manager.main(force_download=True))
+
+        mock_batch_export.assert_called_once_with(force=True)
+        mock_depot_downloader.assert_called_once_with(force=True)
+
+    def test_one_installer_raises(self, mock_batch_export, mock_depot_downloader, mock_logger):
+        """Test an installer raising fails main without stopping the other installer."""
+        mock_batch_export.side_effect = Exception("download failed")
+        mock_depot_downloader.return_value = True
+
+        self.assertFalse(src_dependency_manager.main())
+
+        mock_depot_downloader.assert_called_once()
+        error_messages = [call[0][0] for call in mock_logger.error.call_args_list]
+        self.assertTrue(any("BatchExport" in msg and "download failed" in msg for msg in error_messages))
+        mock_logger.success.assert_not_called()
+
+    def test_both_installers_raise(self, mock_batch_export, mock_depot_downloader, mock_logger):
+        """Test every failing installer is reported."""
+        mock_batch_export.side_effect = Exception("batch export failed")
+        mock_depot_downloader.side_effect = Exception("depot downloader failed")
+
+        self.assertFalse(src_dependency_manager.main())
+
+        error_messages = [call[0][0] for call in mock_logger.error.call_args_list]
+        self.assertTrue(any("BatchExport" in msg for msg in error_messages))
+        self.assertTrue(any("DepotDownloader" in msg for msg in error_messages))
+
+    def test_installer_returning_false(self, mock_batch_export, mock_depot_downloader, mock_logger):
+        """Test an installer reporting failure without raising fails main."""
+        mock_batch_export.return_value = True
+        mock_depot_downloader.return_value = False
+
+        self.assertFalse(src_dependency_manager.main())
+
+        error_messages = [call[0][0] for call in mock_logger.error.call_args_list]
+        self.assertTrue(any("DepotDownloader" in msg for msg in error_messages))
+
+
+if __name__ == '__main__':
+    unittest.main()
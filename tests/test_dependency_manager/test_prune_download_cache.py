@@ -0,0 +1,102 @@
+import unittest
+import os
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add the src directory to the Python path to import dependency_manager
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+sys.path.insert(0, src_path)
+
+# Import directly from the src.dependency_manager module to avoid conflicts
+import importlib.util
+spec = importlib.util.spec_from_file_location("src_dependency_manager", os.path.join(src_path, "dependency_manager.py"))
+src_dependency_manager = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(src_dependency_manager)
+
+DependencyManager = src_dependency_manager.DependencyManager
+
+
+class TestPruneDownloadCache(unittest.TestCase):
+    """Test cases for _prune_download_cache function"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.dm = DependencyManager()
+        self.test_dir = tempfile.mkdtemp()
+        self.dm.download_cache_dir = Path(self.test_dir)
+        self.current_url = "https://github.com/owner/tool/releases/download/v2/Tool-windows-x64.zip"
+        self.stale_url = "https://github.com/owner/tool/releases/download/v1/Tool-windows-x64.zip"
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _create_cached_download(self, url):
+        """Helper method to create a cached download and its ETag for a URL."""
+        cached_file = self.dm._get_download_cache_path(url)
+        cached_file.parent.mkdir(parents=True, exist_ok=True)
+        cached_file.write_bytes(b"zip data")
+        self.dm._get_etag_path(cached_file).write_text('"etag"')
+        return cached_file
+
+    def test_keeps_current_and_removes_stale(self):
+        """Test the current archive and ETag are kept while older versions of it are removed."""
+        current_file = self._create_cached_download(self.current_url)
+        stale_file = self._create_cached_download(self.stale_url)
+
+        with patch.object(src_dependency_manager, 'logger'):
+            self.dm._prune_download_cache(current_file)
+
+        self.assertTrue(current_file.exists())
+        self.assertTrue(self.dm._get_etag_path(current_file).exists())
+        self.assertFalse(stale_file.exists())
+        self.assertFalse(self.dm._get_etag_path(stale_file).exists())
+
+    def test_keeps_other_assets(self):
+        """Test cached downloads of differently named files are left alone."""
+        current_file = self._create_cached_download(self.current_url)
+        other_file = self._create_cached_download("https://github.com/owner/tool/releases/download/v1/Other-windows-x64.zip")
+
+        with patch.object(src_dependency_manager, 'logger'):
+            self.dm._prune_download_cache(current_file)
+
+        self.assertTrue(other_file.exists())
+        self.assertTrue(self.dm._get_etag_path(other_file).exists())
+
+    def test_keeps_same_named_asset_from_other_repo(self):
+        """Test a same-named asset downloaded from another repo is not treated as an older version."""
+        current_file = self._create_cached_download(self.current_url)
+        other_repo_file = self._create_cached_download("https://github.com/other/tool/releases/download/v9/Tool-windows-x64.zip")
+        self.assertNotEqual(current_file.parent, other_repo_file.parent)
+
+        with patch.object(src_dependency_manager, 'logger'):
+            self.dm._prune_download_cache(current_file)
+
+        self.assertTrue(current_file.exists())
+        self.assertTrue(other_repo_file.exists())
+        self.assertTrue(self.dm._get_etag_path(other_repo_file).exists())
+
+    def test_releases_of_one_repo_share_a_directory(self):
+        """Test downloads from different releases of the same repo are cached side by side."""
+        self.assertEqual(self.dm._get_download_cache_path(self.current_url).parent,
+                         self.dm._get_download_cache_path(self.stale_url).parent)
+
+    def test_current_without_etag(self):
+        """Test pruning works when the current download has no ETag."""
+        current_file = self._create_cached_download(self.current_url)
+        self.dm._get_etag_path(current_file).unlink()
+        stale_file = self._create_cached_download(self.stale_url)
+
+        with patch.object(src_dependency_manager, 'logger'):
+            self.dm._prune_download_cache(current_file)
+
+        self.assertTrue(current_file.exists())
+        self.assertFalse(stale_file.exists())
+        self.assertFalse(self.dm._get_etag_path(stale_file).exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
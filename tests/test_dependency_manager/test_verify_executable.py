@@ -100,6 +100,55 @@ class TestVerifyExecutable(unittest.TestCase):
                     break
             self.assertTrue(move_log_found, "Move operation was not logged properly")
 
+    def test_verify_executable_uses_extracted_files_index(self):
+        """Test _verify_executable moves the executable listed in extracted_files without searching."""
+        executable_name = "app.exe"
+        subdir = self.output_path / "bin"
+        subdir.mkdir()
+        executable_subpath = subdir / executable_name
+        self._create_test_executable(executable_subpath, size_bytes=512)
+
+        with patch.object(Path, 'rglob') as mock_rglob:
+            with patch.object(src_dependency_manager, 'logger'):
+                self.dm._verify_executable(self.output_path, executable_name, {executable_name: executable_subpath})
+
+            mock_rglob.assert_not_called()
+
+        self.assertTrue((self.output_path / executable_name).exists())
+        self.assertFalse(executable_subpath.exists())
+
+    def test_verify_executable_stale_extracted_files_index_falls_back_to_search(self):
+        """Test _verify_executable searches subdirectories when the indexed path no longer exists."""
+        executable_name = "app.exe"
+        subdir = self.output_path / "bin"
+        subdir.mkdir()
+        executable_subpath = subdir / executable_name
+        self._create_test_executable(executable_subpath, size_bytes=512)
+        stale_path = self.output_path / "old" / executable_name
+
+        with patch.object(src_dependency_manager, 'logger'):
+            self.dm._verify_executable(self.output_path, executable_name, {executable_name: stale_path})
+
+        self.assertTrue((self.output_path / executable_name).exists())
+        self.assertFalse(executable_subpath.exists())
+
+    def test_verify_executable_found_in_child_directory_without_search(self):
+        """Test _verify_executable finds an executable one level down without a recursive search."""
+        executable_name = "child.exe"
+        subdir = self.output_path / "bin"
+        subdir.mkdir()
+        executable_subpath = subdir / executable_name
+        self._create_test_executable(executable_subpath)
+
+        with patch.object(Path, 'rglob') as mock_rglob:
+            with patch.object(src_dependency_manager, 'logger'):
+                self.dm._verify_executable(self.output_path, executable_name)
+
+            mock_rglob.assert_not_called()
+
+        self.assertTrue((self.output_path / executable_name).exists())
+        self.assertFalse(executable_subpath.exists())
+
     def test_verify_executable_found_in_nested_subdirectory(self):
         """Test _verify_executable finds executable in deeply nested subdirectory."""
         executable_name = "deep.exe"
@@ -203,12 +252,12 @@ class TestVerifyExecutable(unittest.TestCase):
         executable_subpath = subdir / executable_name
         self._create_test_executable(executable_subpath)
         
-        # Mock shutil.move to raise exception
-        with patch('shutil.move', side_effect=PermissionError("Access denied")):
+        # Mock os.replace to raise exception
+        with patch('os.replace', side_effect=PermissionError("Access denied")):
             with self.assertRaises(Exception) as context:
                 self.dm._verify_executable(self.output_path, executable_name)
             
-            # Should propagate the exception from shutil.move
+            # Should propagate the exception from os.replace
             self.assertIn("Access denied", str(context.exception))
 
     def test_verify_executable_case_insensitive_search(self):
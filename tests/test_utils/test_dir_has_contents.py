@@ -0,0 +1,64 @@
+import unittest
+import sys
+import os
+import tempfile
+import shutil
+
+# Add the src directory to the Python path to import utils
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+sys.path.insert(0, src_path)
+
+# Import directly from the src.utils module to avoid conflicts with tests.utils
+import importlib.util
+spec = importlib.util.spec_from_file_location("src_utils", os.path.join(src_path, "utils.py"))
+src_utils = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(src_utils)
+
+dir_has_contents = src_utils.dir_has_contents
+
+
+class TestDirHasContents(unittest.TestCase):
+    """Test cases for the dir_has_contents function."""
+
+    def setUp(self):
+        """Set up temporary directory for each test."""
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up temporary directory after each test."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_dir_has_contents_empty_directory(self):
+        """Test dir_has_contents returns False for an empty directory."""
+        self.assertFalse(dir_has_contents(self.test_dir))
+
+    def test_dir_has_contents_with_file(self):
+        """Test dir_has_contents returns True when a file is present."""
+        with open(os.path.join(self.test_dir, "file.json"), 'w') as f:
+            f.write("{}")
+
+        self.assertTrue(dir_has_contents(self.test_dir))
+
+    def test_dir_has_contents_with_subdirectory_only(self):
+        """Test dir_has_contents returns True when only an empty subdirectory is present."""
+        os.makedirs(os.path.join(self.test_dir, "subdir"))
+
+        self.assertTrue(dir_has_contents(self.test_dir))
+
+    def test_dir_has_contents_nonexistent_directory(self):
+        """Test dir_has_contents returns False for a missing directory."""
+        missing_dir = os.path.join(self.test_dir, "does_not_exist")
+
+        self.assertFalse(dir_has_contents(missing_dir))
+
+    def test_dir_has_contents_path_is_file(self):
+        """Test dir_has_contents returns False when the path is a file."""
+        file_path = os.path.join(self.test_dir, "file.txt")
+        with open(file_path, 'w') as f:
+            f.write("content")
+
+        self.assertFalse(dir_has_contents(file_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+import sys
+import os
+from unittest.mock import Mock, patch
+
+# Add the src directory to the Python path to import utils
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+sys.path.insert(0, src_path)
+
+# Import directly from the src.utils module to avoid conflicts with tests.utils
+import importlib.util
+spec = importlib.util.spec_from_file_location("src_utils", os.path.join(src_path, "utils.py"))
+src_utils = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(src_utils)
+
+wait_for_process_input_idle = src_utils.wait_for_process_input_idle
+
+
+class TestWaitForProcessInputIdle(unittest.TestCase):
+    """Test cases for the wait_for_process_input_idle function."""
+
+    def _mock_ctypes(self, handle=1234, wait_result=0):
+        """Create a mock ctypes module with the Windows structure."""
+        mock_ctypes = Mock()
+        mock_ctypes.windll.kernel32.OpenProcess.return_value = handle
+        mock_ctypes.windll.user32.WaitForInputIdle.return_value = wait_result
+        return mock_ctypes
+
+    @patch('os.name', 'nt')
+    def test_wait_for_process_input_idle_ready(self):
+        """Test wait_for_process_input_idle returns True once the process is idle."""
+        mock_ctypes = self._mock_ctypes(wait_result=0)
+
+        with patch.dict('sys.modules', {'ctypes': mock_ctypes}):
+            result = wait_for_process_input_idle(42, timeout=5)
+
+        self.assertTrue(result)
+        mock_ctypes.windll.user32.WaitForInputIdle.assert_called_once_with(1234, 5000)
+        mock_ctypes.windll.kernel32.CloseHandle.assert_called_once_with(1234)
+
+    @patch('os.name', 'nt')
+    def test_wait_for_process_input_idle_timeout(self):
+        """Test wait_for_process_input_idle returns False when the wait times out."""
+        mock_ctypes = self._mock_ctypes(wait_result=0x102)  # WAIT_TIMEOUT
+
+        with patch.dict('sys.modules', {'ctypes': mock_ctypes}):
+            result = wait_for_process_input_idle(42)
+
+        self.assertFalse(result)
+        mock_ctypes.windll.kernel32.CloseHandle.assert_called_once_with(1234)
+
+    @patch('os.name', 'nt')
+    def test_wait_for_process_input_idle_open_process_fails(self):
+        """Test wait_for_process_input_idle returns False when the process can't be opened."""
+        mock_ctypes = self._mock_ctypes(handle=0)
+
+        with patch.dict('sys.modules', {'ctypes': mock_ctypes}):
+            result = wait_for_process_input_idle(42)
+
+        self.assertFalse(result)
+        mock_ctypes.windll.user32.WaitForInputIdle.assert_not_called()
+        mock_ctypes.windll.kernel32.CloseHandle.assert_not_called()
+
+    @patch('os.name', 'posix')
+    def test_wait_for_process_input_idle_non_windows(self):
+        """Test wait_for_process_input_idle returns False on non-Windows systems."""
+        self.assertFalse(wait_for_process_input_idle(42))
+
+
+if __name__ == '__main__':
+    unittest.main()
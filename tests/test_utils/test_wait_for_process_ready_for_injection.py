@@ -124,7 +124,7 @@ class TestWaitForProcessReadyForInjection(unittest.TestCase):
         expected_log_calls = [
             call("Waiting for notepad.exe to start..."),
             call("Process notepad.exe found (PID: 1234), waiting for full initialization..."),
-            call("Initialization progress: 5/2 seconds..."),
+            call("Initialization progress: 2/2 seconds..."),
             call("Process notepad.exe should now be ready for injection")
         ]
         self.mock_logger.info.assert_has_calls(expected_log_calls)
@@ -155,7 +155,7 @@ class TestWaitForProcessReadyForInjection(unittest.TestCase):
         progress_logs = [call for call in self.mock_logger.info.call_args_list 
                         if 'Initialization progress:' in str(call)]
         expected_progress = [
-            call("Initialization progress: 5/2 seconds...")
+            call("Initialization progress: 2/2 seconds...")
         ]
         self.assertEqual(progress_logs, expected_progress)
     
@@ -200,7 +200,7 @@ class TestWaitForProcessReadyForInjection(unittest.TestCase):
         expected_log_calls = [
             call("Waiting for firefox to start..."),
             call("Process firefox found (PID: 2468), waiting for full initialization..."),
-            call("Initialization progress: 5/2 seconds..."),
+            call("Initialization progress: 2/2 seconds..."),
             call("Process firefox should now be ready for injection")
         ]
         self.mock_logger.info.assert_has_calls(expected_log_calls)
@@ -262,19 +262,38 @@ class TestWaitForProcessReadyForInjection(unittest.TestCase):
         
         self.assertEqual(result, 2222)
         
-        # Should make checks at 5s (range(0, 3, 5) = [0])
+        # Should make a single check after sleeping the 3 remaining seconds (range(0, 3, 5) = [0])
         # So 1 sleep call and 1 subprocess call
-        self.assertEqual(mock_sleep.call_count, 1)
+        mock_sleep.assert_called_once_with(3)
         self.assertEqual(mock_subprocess_run.call_count, 1)
         
         # Verify progress logging
         progress_logs = [call for call in self.mock_logger.info.call_args_list 
                         if 'Initialization progress:' in str(call)]
         expected_progress = [
-            call("Initialization progress: 5/3 seconds...")
+            call("Initialization progress: 3/3 seconds...")
         ]
         self.assertEqual(progress_logs, expected_progress)
     
+    @timeout(5)
+    @patch('time.sleep')
+    @patch.object(src_utils, 'wait_for_process_by_name')
+    @patch('os.name', 'posix')
+    def test_last_chunk_sleeps_only_the_remainder(self, mock_wait_for_process, mock_sleep):
+        """Test that the total sleep matches the initialization time instead of rounding up to the interval."""
+        mock_wait_for_process.return_value = 3333
+        
+        result = wait_for_process_ready_for_injection("test.exe", initialization_time=8)
+        
+        self.assertEqual(result, 3333)
+        self.assertEqual(mock_sleep.call_args_list, [call(5), call(3)])
+        progress_logs = [call for call in self.mock_logger.info.call_args_list 
+                        if 'Initialization progress:' in str(call)]
+        self.assertEqual(progress_logs, [
+            call("Initialization progress: 5/8 seconds..."),
+            call("Initialization progress: 8/8 seconds...")
+        ])
+    
     def test_function_signature_and_docstring(self):
         """Test that the function has the correct signature and docstring."""
         import inspect
@@ -313,7 +332,7 @@ class TestWaitForProcessReadyForInjection(unittest.TestCase):
         # Verify specific log messages exist
         self.assertIn("Waiting for test.exe to start...", all_info_calls)
         self.assertIn("Process test.exe found (PID: 7777), waiting for full initialization...", all_info_calls)
-        self.assertIn("Initialization progress: 5/2 seconds...", all_info_calls)
+        self.assertIn("Initialization progress: 2/2 seconds...", all_info_calls)
         self.assertIn("Process test.exe should now be ready for injection", all_info_calls)
         
         # Verify the sequence is correct